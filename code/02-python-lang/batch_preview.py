@@ -0,0 +1,143 @@
+"""Preview the first characters of many URLs at once, over one shared, pooled async HTTP client.
+
+Each page is streamed and dropped as soon as enough characters arrive, just like show_first_chars,
+but all the URLs share one httpx.AsyncClient: connections are reused, at most `concurrency`
+requests run at once (and at most `per_host` against any one host), and results are printed as
+each one completes rather than in input order.
+
+    python batch_preview.py urls.txt --concurrency 50 --per-host 6 --timeout 10
+    python batch_preview.py python.org talkpython.fm --count 100 --http2
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import sys
+import typing
+from collections.abc import AsyncGenerator, Iterable
+
+import httpx
+
+import show_first_chars
+from show_first_chars import Preview
+
+DEFAULT_CONCURRENCY = 20
+DEFAULT_PER_HOST = 6  # like browsers, avoid hammering any one server
+DEFAULT_TIMEOUT = 10.0
+
+
+class PreviewError(typing.NamedTuple):
+    url: str
+    error: str
+
+
+async def afirst_chars(
+    client: httpx.AsyncClient, url: str, count: int = show_first_chars.DEFAULT_COUNT, use_range: bool = False
+) -> Preview:
+    """The async version of show_first_chars.first_chars, using a client the caller owns."""
+    headers = show_first_chars.request_headers(count, use_range)
+    async with client.stream('GET', url, headers=headers) as resp:
+        resp.raise_for_status()
+        collector = show_first_chars.CharCollector(count, resp.charset_encoding)
+        done = False
+        async for chunk in resp.aiter_bytes(show_first_chars.CHUNK_SIZE):
+            if done := collector.feed(chunk):
+                break
+        return Preview(url, collector.text(final=not done), resp.num_bytes_downloaded, resp.status_code)
+
+
+async def preview_many(
+    urls: Iterable[str],
+    count: int = show_first_chars.DEFAULT_COUNT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+    http2: bool = False,
+    use_range: bool = False,
+) -> AsyncGenerator[Preview | PreviewError, None]:
+    """Fetch previews of many URLs concurrently, yielding each result as soon as it is ready.
+
+    A URL that fails (bad status, timeout, connection error, ...) yields a PreviewError instead
+    of stopping the batch.
+
+    Args:
+        urls: The URLs to preview
+        count: How many characters to keep from each page
+        concurrency: Most requests (and pooled connections) in flight at once
+        per_host: Most requests in flight to any one host
+        timeout: Seconds allowed for connecting, and between bytes of a response
+        http2: Use HTTP/2 where servers offer it (needs the h2 package: pip install httpx[http2])
+        use_range: Also send a Range header for just the bytes needed
+
+    Yields:
+        Preview | PreviewError: One per URL, in the order they finish
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    # The pool's connection limit alone would leave queued requests waiting for a connection under the pool
+    # timeout, failing with PoolTimeout on a long list; queuing here first means they only time out on the network.
+    request_slots = asyncio.Semaphore(concurrency)
+    host_slots: collections.defaultdict[str, asyncio.Semaphore] = collections.defaultdict(
+        lambda: asyncio.Semaphore(per_host)
+    )
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2, follow_redirects=True) as client:
+
+        async def fetch(url: str) -> Preview | PreviewError:
+            try:
+                # Host first, so a request waiting for a busy host does not hold a slot other hosts could use.
+                async with host_slots[httpx.URL(url).host], request_slots:
+                    return await afirst_chars(client, url, count, use_range)
+            except (httpx.HTTPError, httpx.InvalidURL) as exc:
+                return PreviewError(url, str(exc) or type(exc).__name__)
+
+        tasks = [asyncio.create_task(fetch(url)) for url in urls]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def read_urls(sources: list[str]) -> list[str]:
+    # Each source is a file with one URL per line ('-' for stdin; blank lines and # comments are skipped),
+    # or else a URL itself.
+    urls = []
+    for source in sources:
+        if source == '-' or os.path.isfile(source):
+            with sys.stdin if source == '-' else open(source) as lines:
+                urls.extend(line.strip() for line in lines if line.strip() and not line.startswith('#'))
+        else:
+            urls.append(source)
+    return [url if url.startswith('http') else 'https://' + url for url in urls]
+
+
+async def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Preview the first characters of many URLs concurrently.')
+    parser.add_argument('sources', nargs='+', help="URLs, or files of URLs one per line ('-' for stdin)")
+    parser.add_argument('--count', type=int, default=show_first_chars.DEFAULT_COUNT)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--http2', action='store_true')
+    parser.add_argument('--range', action='store_true', dest='use_range', help='send a Range header')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    urls = read_urls(args.sources)
+    async for result in preview_many(
+        urls, args.count, args.concurrency, args.per_host, args.timeout, args.http2, args.use_range
+    ):
+        if isinstance(result, PreviewError):
+            failures += 1
+            print(f'{result.url}: FAILED ({result.error})')
+        else:
+            text = ' '.join(result.text.split())
+            print(f'{result.url} [{result.status_code}, {result.bytes_transferred:,} bytes]: {text}')
+    print(f'\n{len(urls) - failures} of {len(urls)} URLs previewed.')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures: a local HTTP server for the show_first_chars and batch_preview tests."""
+
+import pytest
+
+import local_server
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = local_server.start_server()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def page() -> bytes:
+    return local_server.PAGE
@@ -0,0 +1,63 @@
+"""A local HTTP server that serves one large page, for the preview tests and the preview throughput benchmark.
+
+Besides the page itself it answers a few special paths that exercise edge cases:
+/missing (404), /latin1 (a latin-1 charset), /bad-charset (an unknown charset), /range (honors Range headers)
+and /slow (waits SLOW_SECONDS first). start_server(latency) adds that latency to every response instead,
+standing in for the network round trips that dominate previewing real sites.
+"""
+
+import http.server
+import sys
+import threading
+import time
+
+PAGE = ('<html><body>' + 'All work and no play makes Jack a dull boy. ' * 5_000 + '</body></html>').encode()
+SLOW_SECONDS = 0.3
+
+
+class PageHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so pooled clients can reuse connections
+    latency = 0.0  # seconds to wait before every response
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        if self.path.startswith('/missing'):
+            self._send(404, b'not found', 'text/plain')
+        elif self.path.startswith('/latin1'):
+            self._send(200, 'café au lait'.encode('latin-1'), 'text/plain; charset=iso-8859-1')
+        elif self.path.startswith('/bad-charset'):
+            self._send(200, 'héllo wörld'.encode(), 'text/html; charset=no-such-charset')
+        elif self.path.startswith('/range') and self.headers.get('Range'):
+            end = int(self.headers['Range'].removeprefix('bytes=0-'))
+            self._send(206, PAGE[: end + 1], 'text/html; charset=utf-8')
+        else:
+            if self.path.startswith('/slow'):
+                time.sleep(SLOW_SECONDS)
+            self._send(200, PAGE, 'text/html; charset=utf-8')
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class QuietServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients hang up mid-response on purpose once they have enough characters.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def start_server(latency: float = 0.0) -> QuietServer:
+    """Serve on a free port of 127.0.0.1 from a background thread. Call shutdown() and server_close() when done."""
+    handler = type('Handler', (PageHandler,), {'latency': latency})
+    server = QuietServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
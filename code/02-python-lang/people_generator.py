@@ -0,0 +1,137 @@
+"""Fast, reproducible generation of speedtest's random people, in batches built from NumPy arrays.
+
+speedtest.py makes each person with 16 calls to random.choice. Here a whole batch of names and
+emails comes from one array of random letters, so ten million people take seconds:
+
+    people = list(generate_dicts(1_000_000, seed=42))
+    store = generate_store(10_000_000, seed=42, workers=4)
+
+Every batch draws from its own stream spawned from one np.random.SeedSequence, so the people
+depend only on the seed and the batch size, never on how many worker processes made them.
+"""
+
+import collections
+import concurrent.futures
+import typing
+from collections.abc import Generator
+
+import numpy as np
+
+import people_store
+
+NAME_LENGTH = 8
+DOMAIN = '@gmail.com'
+MIN_AGE = 30
+MAX_AGE = 60
+BATCH_SIZE = 100_000
+LETTERS = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+
+
+class Columns(typing.NamedTuple):
+    """One batch of people as PeopleStore column bytes: NUL-padded names and emails, one byte per age."""
+
+    names: bytes
+    emails: bytes
+    ages: bytes
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+
+def generate_columns(
+    count: int,
+    seed: int | None = None,
+    workers: int = 1,
+    batch_size: int = BATCH_SIZE,
+    name_width: int = NAME_LENGTH,
+    email_width: int = NAME_LENGTH + len(DOMAIN),
+) -> Generator[Columns, None, None]:
+    """Generate count random people as batches of column bytes, ready for PeopleStore.extend_columns.
+
+    Names and emails are NAME_LENGTH random lowercase letters (emails then add DOMAIN), and ages
+    are uniform from MIN_AGE to MAX_AGE inclusive, just like speedtest.py's people.
+
+    Args:
+        count: How many people to generate
+        seed: Seed for the batches' SeedSequence; None for fresh OS entropy
+        workers: Worker processes to generate batches in (1 generates them in this process)
+        batch_size: People per batch
+        name_width: Width of the name column (at least NAME_LENGTH)
+        email_width: Width of the email column (at least NAME_LENGTH + len(DOMAIN))
+
+    Yields:
+        Columns: The batches, in order; all but the last hold batch_size people
+
+    Raises:
+        ValueError: If count is negative, batch_size is not positive, or a width is too small
+    """
+    if count < 0:
+        raise ValueError('count must be non-negative')
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+    if name_width < NAME_LENGTH or email_width < NAME_LENGTH + len(DOMAIN):
+        raise ValueError('Column widths are too small for the generated names and emails')
+
+    sizes = [min(batch_size, count - start) for start in range(0, count, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers <= 1:
+        for size, batch_seed in zip(sizes, seeds):
+            yield _make_batch(batch_seed, size, name_width, email_width)
+        return
+
+    # Like mathf.fibonacci_parallel: keep a few batches in flight and hand them back in order.
+    max_in_flight = 2 * workers
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: collections.deque[concurrent.futures.Future] = collections.deque()
+        for size, batch_seed in zip(sizes, seeds):
+            in_flight.append(pool.submit(_make_batch, batch_seed, size, name_width, email_width))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def generate_dicts(
+    count: int, seed: int | None = None, workers: int = 1, batch_size: int = BATCH_SIZE
+) -> Generator[dict, None, None]:
+    """Generate count random people in speedtest.py's dict format: {'name': ..., 'email': ..., 'age': ...}.
+
+    The people are the same as generate_columns and generate_store make from the same seed and batch_size.
+    """
+    email_width = NAME_LENGTH + len(DOMAIN)
+    for batch in generate_columns(count, seed, workers, batch_size, NAME_LENGTH, email_width):
+        # The widths are exact here, so the columns convert straight to strings with no padding to strip.
+        names = np.frombuffer(batch.names, dtype=f'S{NAME_LENGTH}').astype(str).tolist()
+        emails = np.frombuffer(batch.emails, dtype=f'S{email_width}').astype(str).tolist()
+        for name, email, age in zip(names, emails, batch.ages):
+            yield {'name': name, 'email': email, 'age': age}
+
+
+def generate_store(
+    count: int,
+    seed: int | None = None,
+    workers: int = 1,
+    batch_size: int = BATCH_SIZE,
+    name_width: int = NAME_LENGTH,
+    email_width: int = NAME_LENGTH + len(DOMAIN),
+) -> people_store.PeopleStore:
+    """Generate count random people straight into a new PeopleStore, without making any dicts."""
+    store = people_store.PeopleStore(name_width, email_width)
+    for batch in generate_columns(count, seed, workers, batch_size, name_width, email_width):
+        store.extend_columns(*batch)
+    return store
+
+
+def _make_batch(seed: np.random.SeedSequence, size: int, name_width: int, email_width: int) -> Columns:
+    rng = np.random.default_rng(seed)
+    letters = LETTERS[rng.integers(0, len(LETTERS), size=(size, 2 * NAME_LENGTH), dtype=np.uint8)]
+
+    names = np.zeros((size, name_width), dtype=np.uint8)
+    names[:, :NAME_LENGTH] = letters[:, :NAME_LENGTH]
+
+    emails = np.zeros((size, email_width), dtype=np.uint8)
+    emails[:, :NAME_LENGTH] = letters[:, NAME_LENGTH:]
+    emails[:, NAME_LENGTH : NAME_LENGTH + len(DOMAIN)] = np.frombuffer(DOMAIN.encode(), dtype=np.uint8)
+
+    ages = rng.integers(MIN_AGE, MAX_AGE, size=size, dtype=np.uint8, endpoint=True)
+    return Columns(names.tobytes(), emails.tobytes(), ages.tobytes())
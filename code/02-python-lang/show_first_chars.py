@@ -1,15 +1,87 @@
+import codecs
+import typing
+
 import httpx
 
-url = input("What URL will we download? ")
+DEFAULT_COUNT = 250
+CHUNK_SIZE = 16 * 1024
+MAX_BYTES_PER_CHAR = 4  # the most any UTF-8 character takes, so a Range this long always holds enough characters
+
+
+class Preview(typing.NamedTuple):
+    url: str
+    text: str  # at most the requested number of characters
+    bytes_transferred: int  # body bytes actually read from the network, before any content decoding
+    status_code: int
+
+
+class CharCollector:
+    """Decodes body chunks as they arrive, until enough characters have been collected."""
+
+    def __init__(self, count: int, encoding: str | None):
+        self.count = count
+        try:
+            decoder_type = codecs.getincrementaldecoder(encoding or 'utf-8')
+        except LookupError:
+            # The charset comes straight from the server's Content-Type, which may name one Python doesn't know.
+            decoder_type = codecs.getincrementaldecoder('utf-8')
+        self.decoder = decoder_type(errors='replace')
+        self.parts: list[str] = []
+        self.length = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Decode one chunk, returning True once count characters are in hand."""
+        part = self.decoder.decode(chunk)
+        self.parts.append(part)
+        self.length += len(part)
+        return self.length >= self.count
+
+    def text(self, final: bool = False) -> str:
+        # final flushes any bytes the decoder is holding, for when the body ended before count characters.
+        if final:
+            self.parts.append(self.decoder.decode(b'', final=True))
+        return ''.join(self.parts)[: self.count]
+
+
+def request_headers(count: int, use_range: bool) -> dict[str, str]:
+    # A Range counts bytes of the encoded body, so ask for it uncompressed.
+    if not use_range:
+        return {}
+    return {'Range': f'bytes=0-{count * MAX_BYTES_PER_CHAR - 1}', 'Accept-Encoding': 'identity'}
+
+
+def first_chars(
+    url: str, count: int = DEFAULT_COUNT, use_range: bool = False, client: httpx.Client | None = None
+) -> Preview:
+    # Stream the body, decoding it as it arrives, and hang up as soon as we have count characters,
+    # rather than downloading the whole page just to show the start of it.
+    # With use_range, ask the server for only the bytes we could need; servers that ignore Range still work.
+    own_client = client is None
+    client = client or httpx.Client(follow_redirects=True)
+    try:
+        with client.stream('GET', url, headers=request_headers(count, use_range)) as resp:
+            resp.raise_for_status()
+            collector = CharCollector(count, resp.charset_encoding)
+            done = False
+            for chunk in resp.iter_bytes(CHUNK_SIZE):
+                if done := collector.feed(chunk):
+                    break
+            # Leaving the with block closes the response; an unfinished one is dropped, not read to the end.
+            return Preview(url, collector.text(final=not done), resp.num_bytes_downloaded, resp.status_code)
+    finally:
+        if own_client:
+            client.close()
+
 
-if not url.startswith('http'):
-    url = 'https://' + url
+if __name__ == '__main__':
+    url = input('What URL will we download? ')
 
-resp = httpx.get(url, follow_redirects=True)
-resp.raise_for_status()
+    if not url.startswith('http'):
+        url = 'https://' + url
 
-text = resp.text
-count = 250
-print(f"The first {count} letters from {url} are:")
-print()
-print(text[0:count])
+    preview = first_chars(url, DEFAULT_COUNT)
+    print(f'The first {DEFAULT_COUNT} letters from {url} are:')
+    print()
+    print(preview.text)
+    print()
+    print(f'(Read {preview.bytes_transferred:,} bytes of the page to get them.)')
@@ -0,0 +1,71 @@
+"""Unit tests for the batch_preview module."""
+
+import asyncio
+
+from batch_preview import Preview, PreviewError, main, preview_many, read_urls
+
+
+TIMEOUT = 1.0  # a few times local_server.SLOW_SECONDS, the delay before each /slow response
+
+
+def collect(urls: list[str], **kwargs) -> list[Preview | PreviewError]:
+    async def run():
+        return [result async for result in preview_many(urls, **kwargs)]
+
+    return asyncio.run(run())
+
+
+class TestPreviewMany:
+    """Tests for concurrent previews over one pooled client."""
+
+    def test_previews_every_url(self, base_url, page):
+        """Test that every URL yields one preview of its first characters."""
+        urls = [f'{base_url}/page/{i}' for i in range(10)]
+        results = collect(urls, count=20, concurrency=4)
+        assert sorted(r.url for r in results) == sorted(urls)
+        assert all(isinstance(r, Preview) and r.text == page[:20].decode() for r in results)
+
+    def test_failures_do_not_stop_the_batch(self, base_url):
+        """Test that bad statuses, bad URLs and unknown charsets are reported per URL, not raised."""
+        urls = [f'{base_url}/missing', 'http://', f'{base_url}/bad-charset', f'{base_url}/page']
+        results = {r.url: r for r in collect(urls, count=5)}
+        assert isinstance(results[f'{base_url}/missing'], PreviewError)
+        assert isinstance(results['http://'], PreviewError)
+        assert results[f'{base_url}/bad-charset'].text == 'héllo'
+        assert isinstance(results[f'{base_url}/page'], Preview)
+
+    def test_queued_urls_wait_for_a_slot_not_the_pool(self, base_url):
+        """Test that URLs beyond `concurrency` queue without hitting the pool timeout.
+
+        Each /slow response takes local_server.SLOW_SECONDS, and the last URLs wait more than twice the timeout:
+        waiting for a pooled connection under the timeout would fail them with PoolTimeout.
+        """
+        urls = [f'{base_url}/slow/{i}' for i in range(16)]
+        results = collect(urls, count=5, concurrency=2, per_host=16, timeout=TIMEOUT)
+        assert [r for r in results if isinstance(r, PreviewError)] == []
+
+    def test_results_arrive_as_they_finish(self, base_url):
+        """Test that a fast page is yielded before a slow one that was listed first."""
+        results = collect([f'{base_url}/slow/1', f'{base_url}/page'], count=5)
+        assert [r.url for r in results] == [f'{base_url}/page', f'{base_url}/slow/1']
+
+
+class TestCommandLine:
+    """Tests for reading URLs and the command-line entry point."""
+
+    def test_read_urls(self, tmp_path):
+        """Test that files of URLs are read, skipping blanks and comments, and bare hosts get https://."""
+        url_file = tmp_path / 'urls.txt'
+        url_file.write_text('# sites\nexample.com\n\nhttp://localhost:8000/\n')
+        assert read_urls([str(url_file), 'python.org']) == [
+            'https://example.com',
+            'http://localhost:8000/',
+            'https://python.org',
+        ]
+
+    def test_main_exit_status(self, base_url, capsys):
+        """Test that main exits 0 when every URL previews and 1 when any fails."""
+        assert asyncio.run(main([f'{base_url}/page', '--count', '10'])) == 0
+        assert '1 of 1 URLs previewed' in capsys.readouterr().out
+        assert asyncio.run(main([f'{base_url}/page', f'{base_url}/missing'])) == 1
+        assert 'FAILED' in capsys.readouterr().out
@@ -0,0 +1,91 @@
+"""Unit tests for the people_file module."""
+
+import os
+import pathlib
+
+import pytest
+import people_file
+from people_generator import generate_store
+from people_store import HashIndex
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'people.dat')
+
+
+@pytest.fixture
+def store():
+    return generate_store(1_000, seed=3, batch_size=256)
+
+
+class TestPeopleFile:
+    """Tests for saving and memory-mapping a PeopleStore."""
+
+    def test_round_trip(self, path, store):
+        """Test that a loaded store reads back the same people and finds them through its email index."""
+        people_file.save(store, path)
+        loaded, by_email = people_file.load(path)
+        assert loaded.read_only
+        assert loaded.to_dicts() == store.to_dicts()
+        email = store.email(500)
+        assert 500 in by_email.lookup(email)
+
+    def test_saved_index_is_reused(self, path, store):
+        """Test that loading leaves an up-to-date index file alone."""
+        store.add_index(HashIndex('email'))
+        people_file.save(store, path)
+        index_mtime = os.stat(path + '.idx').st_mtime_ns
+        people_file.load(path)
+        assert os.stat(path + '.idx').st_mtime_ns == index_mtime
+
+    def test_stale_index_is_rebuilt(self, path, store):
+        """Test that an index saved for an older data file is rebuilt when the data file changes."""
+        people_file.save(store, path)
+        stale_index = pathlib.Path(path + '.idx').read_bytes()
+
+        other = generate_store(1_001, seed=4, batch_size=256)  # a different size, whatever the clock resolution
+        people_file.save(other, path)
+        pathlib.Path(path + '.idx').write_bytes(stale_index)
+
+        loaded, by_email = people_file.load(path)
+        email = other.email(10)
+        assert 10 in by_email.lookup(email)
+        assert pathlib.Path(path + '.idx').read_bytes() != stale_index
+
+    def test_missing_index_is_rebuilt(self, path, store):
+        """Test that a data file without its index still loads, and the index is written for next time."""
+        people_file.save(store, path)
+        os.remove(path + '.idx')
+        _, by_email = people_file.load(path)
+        assert by_email.lookup(store.email(0)) == [0]
+        assert os.path.exists(path + '.idx')
+
+    def test_loaded_store_is_read_only(self, path, store):
+        """Test that appending to a memory-mapped store raises TypeError."""
+        people_file.save(store, path)
+        loaded, _ = people_file.load(path)
+        with pytest.raises(TypeError, match='read-only'):
+            loaded.append('abc', 'abc@gmail.com', 40)
+
+    def test_truncated_file_raises_error(self, path, store):
+        """Test that a data file cut short raises ValueError."""
+        people_file.save(store, path)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        with pytest.raises(ValueError, match='truncated or corrupt'):
+            people_file.load(path)
+
+    def test_interrupted_save_leaves_old_files(self, path, store):
+        """Test that a save which fails partway changes nothing on disk, and leaves no temporary files."""
+        people_file.save(store, path)
+        directory = pathlib.Path(path).parent
+        before = {file.name: file.read_bytes() for file in directory.iterdir()}
+
+        def chunks():
+            yield b'the first chunk'
+            raise OSError('No space left on device')
+
+        with pytest.raises(OSError, match='No space left'):
+            people_file._replace_file(path, chunks())
+        assert {file.name: file.read_bytes() for file in directory.iterdir()} == before
@@ -0,0 +1,46 @@
+"""Unit tests for the people_generator module."""
+
+import pytest
+from people_generator import DOMAIN, MAX_AGE, MIN_AGE, NAME_LENGTH, generate_columns, generate_dicts, generate_store
+
+
+class TestGenerator:
+    """Tests for the batched people generator."""
+
+    def test_people_look_like_speedtest_people(self):
+        """Test that names, emails and ages have speedtest's shape."""
+        people = list(generate_dicts(500, seed=1, batch_size=64))
+        assert len(people) == 500
+        for person in people:
+            assert len(person['name']) == NAME_LENGTH and person['name'].isalpha() and person['name'].islower()
+            assert person['email'].endswith(DOMAIN) and len(person['email']) == NAME_LENGTH + len(DOMAIN)
+            assert MIN_AGE <= person['age'] <= MAX_AGE
+
+    def test_same_seed_same_people(self):
+        """Test that a seed and batch size fix the people, whatever the number of workers."""
+        alone = list(generate_dicts(300, seed=5, batch_size=64))
+        assert list(generate_dicts(300, seed=5, batch_size=64, workers=2)) == alone
+        assert list(generate_dicts(300, seed=6, batch_size=64)) != alone
+
+    def test_store_matches_dicts(self):
+        """Test that generate_store makes the same people as generate_dicts, in wider columns if asked."""
+        store = generate_store(300, seed=5, batch_size=64, name_width=12, email_width=24)
+        assert store.to_dicts() == list(generate_dicts(300, seed=5, batch_size=64))
+
+    def test_batches(self):
+        """Test that every batch but the last is full."""
+        assert [len(batch) for batch in generate_columns(250, seed=1, batch_size=100)] == [100, 100, 50]
+        assert list(generate_columns(0)) == []
+
+    @pytest.mark.parametrize(
+        'kwargs,message',
+        [
+            ({'count': -1}, 'count must be non-negative'),
+            ({'count': 1, 'batch_size': 0}, 'batch_size must be positive'),
+            ({'count': 1, 'name_width': NAME_LENGTH - 1}, 'Column widths are too small'),
+        ],
+    )
+    def test_bad_arguments_raise_error(self, kwargs, message):
+        """Test that invalid arguments raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            list(generate_columns(**kwargs))
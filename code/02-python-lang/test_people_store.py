@@ -0,0 +1,116 @@
+"""Unit tests for the people_store module."""
+
+import pytest
+from people_store import HashIndex, Index, PeopleStore, PrefixIndex, SortedIndex
+
+PEOPLE = [
+    {'name': 'carol', 'email': 'carol@example.com', 'age': 41},
+    {'name': 'alice', 'email': 'alice@example.com', 'age': 35},
+    {'name': 'bob', 'email': 'bob@example.com', 'age': 41},
+    {'name': 'alicia', 'email': 'alicia@example.com', 'age': 52},
+    {'name': 'al', 'email': 'alice@example.com', 'age': 35},
+]
+
+
+@pytest.fixture
+def store():
+    return PeopleStore.from_dicts(PEOPLE, name_width=8, email_width=20)
+
+
+class TestPeopleStore:
+    """Tests for the columnar store itself."""
+
+    def test_rows_read_back_as_dicts(self, store):
+        """Test that every row reads back as the dict it was made from."""
+        assert len(store) == len(PEOPLE)
+        assert [person.to_dict() for person in store] == PEOPLE
+        assert store.to_dicts() == PEOPLE
+
+    def test_append_returns_row_number(self, store):
+        """Test that append adds a row at the end and returns its number."""
+        assert store.append('dave', 'dave@example.com', 60) == len(PEOPLE)
+        assert store[len(PEOPLE)].to_dict() == {'name': 'dave', 'email': 'dave@example.com', 'age': 60}
+
+    def test_value_too_wide_raises_error(self, store):
+        """Test that a value longer than its column raises ValueError."""
+        with pytest.raises(ValueError, match='longer than 8 bytes'):
+            store.append('bartholomew', 'b@example.com', 30)
+
+    def test_row_out_of_range_raises_error(self, store):
+        """Test that indexing past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            store[len(PEOPLE)]
+
+    def test_mismatched_columns_raise_error(self, store):
+        """Test that extend_columns rejects columns of different lengths."""
+        with pytest.raises(ValueError, match='Column lengths do not match'):
+            store.extend_columns(b'x' * 8, b'y' * 20, bytes([30, 31]))
+
+
+class TestIndexes:
+    """Tests for the hash, sorted and prefix indexes."""
+
+    def test_index_must_implement_build_add_and_nbytes(self):
+        """Test that an Index subclass missing one of its abstract methods cannot be created."""
+
+        class Incomplete(Index):
+            def build(self) -> None:
+                pass
+
+            def add(self, row: int) -> None:
+                pass
+
+        with pytest.raises(TypeError, match='nbytes'):
+            Incomplete('name')
+
+    def test_hash_lookup(self, store):
+        """Test that an exact lookup finds every matching row, in row order."""
+        by_email = store.add_index(HashIndex('email'))
+        assert by_email.lookup('alice@example.com') == [1, 4]
+        assert by_email.lookup('nobody@example.com') == []
+
+    def test_hash_lookup_on_age(self, store):
+        """Test that a hash index works on the integer column too."""
+        by_age = store.add_index(HashIndex('age'))
+        assert by_age.lookup(41) == [0, 2]
+
+    def test_sorted_range(self, store):
+        """Test that a range query returns the rows in value order, ties in row order."""
+        by_age = store.add_index(SortedIndex('age'))
+        assert list(by_age.range(35, 41)) == [1, 4, 0, 2]
+        assert list(by_age.range(53, 60)) == []
+
+    def test_prefix(self, store):
+        """Test that a prefix query returns the rows whose value starts with the prefix, sorted by value."""
+        by_name = store.add_index(PrefixIndex('name'))
+        assert [store.name(row) for row in by_name.startswith('ali')] == ['alice', 'alicia']
+        assert [store.name(row) for row in by_name.startswith('al')] == ['al', 'alice', 'alicia']
+
+    def test_prefix_index_needs_text_field(self):
+        """Test that a prefix index on age raises ValueError."""
+        with pytest.raises(ValueError, match='needs a text field'):
+            PrefixIndex('age')
+
+    def test_unknown_field_raises_error(self):
+        """Test that an index on a field the store does not have raises ValueError."""
+        with pytest.raises(ValueError, match='Unknown field'):
+            HashIndex('phone')
+
+    @pytest.mark.parametrize('bulk', [False, True])
+    def test_indexes_follow_new_rows(self, bulk):
+        """Test that indexes match a fresh build after rows are appended one at a time or in a batch."""
+        store = PeopleStore.from_dicts(PEOPLE[:2], name_width=8, email_width=20)
+        indexes = [store.add_index(HashIndex('email')), store.add_index(SortedIndex('age'))]
+        indexes.append(store.add_index(PrefixIndex('name')))
+        more = PEOPLE[2:] * 30  # enough rows to make the hash table grow
+        if bulk:
+            batch = PeopleStore.from_dicts(more, name_width=8, email_width=20)
+            store.extend_columns(batch.names, batch.emails, bytes(batch.ages))
+        else:
+            for person in more:
+                store.append(person['name'], person['email'], person['age'])
+
+        fresh = PeopleStore.from_dicts(PEOPLE[:2] + more, name_width=8, email_width=20)
+        assert indexes[0].lookup('bob@example.com') == fresh.add_index(HashIndex('email')).lookup('bob@example.com')
+        assert indexes[1].order == fresh.add_index(SortedIndex('age')).order
+        assert indexes[2].order == fresh.add_index(PrefixIndex('name')).order
@@ -0,0 +1,66 @@
+"""Unit tests for the show_first_chars module."""
+
+import httpx
+import pytest
+from show_first_chars import CharCollector, first_chars, request_headers
+
+
+class TestCharCollector:
+    """Tests for the incremental character collector."""
+
+    def test_characters_split_across_chunks(self):
+        """Test that a multi-byte character split between chunks decodes once."""
+        collector = CharCollector(3, 'utf-8')
+        data = 'éüö'.encode()
+        assert not collector.feed(data[:3])
+        assert collector.feed(data[3:])
+        assert collector.text() == 'éüö'
+
+    def test_unknown_charset_falls_back_to_utf8(self):
+        """Test that a charset Python does not know decodes as UTF-8 instead of raising LookupError."""
+        collector = CharCollector(5, 'no-such-charset')
+        collector.feed('héllo wörld'.encode())
+        assert collector.text() == 'héllo'
+
+    def test_range_header(self):
+        """Test that a Range covers enough bytes for count characters, uncompressed."""
+        assert request_headers(10, use_range=False) == {}
+        assert request_headers(10, use_range=True) == {'Range': 'bytes=0-39', 'Accept-Encoding': 'identity'}
+
+
+class TestFirstChars:
+    """Tests for first_chars against a local server."""
+
+    def test_stops_reading_early(self, base_url, page):
+        """Test that only the start of a large page is read to get the characters."""
+        preview = first_chars(f'{base_url}/page', 100)
+        assert preview.text == page[:100].decode()
+        assert preview.status_code == 200
+        assert preview.bytes_transferred < len(page)
+
+    def test_uses_declared_charset(self, base_url):
+        """Test that the page is decoded with the charset from its Content-Type."""
+        assert first_chars(f'{base_url}/latin1', 50).text == 'café au lait'
+
+    def test_unknown_charset(self, base_url):
+        """Test that a page declaring an unknown charset still previews, as UTF-8."""
+        assert first_chars(f'{base_url}/bad-charset', 5).text == 'héllo'
+
+    def test_range_request(self, base_url, page):
+        """Test that with use_range only the requested bytes are sent."""
+        preview = first_chars(f'{base_url}/range', 10, use_range=True)
+        assert preview.status_code == 206
+        assert preview.text == page[:10].decode()
+        assert preview.bytes_transferred == 40
+
+    def test_error_status_raises(self, base_url):
+        """Test that an HTTP error status raises HTTPStatusError."""
+        with pytest.raises(httpx.HTTPStatusError):
+            first_chars(f'{base_url}/missing')
+
+    def test_shared_client_is_left_open(self, base_url, page):
+        """Test that a client passed in is reused and not closed."""
+        with httpx.Client() as client:
+            first_chars(f'{base_url}/page', 10, client=client)
+            assert not client.is_closed
+            assert first_chars(f'{base_url}/page', 10, client=client).text == page[:10].decode()
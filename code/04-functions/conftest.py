@@ -0,0 +1,46 @@
+"""Shared pytest fixtures for the Game of Life engine tests."""
+
+import random
+
+import pytest
+from life_functions import get_engine, run_one_generation
+
+
+@pytest.fixture
+def random_grid():
+    """Make a reproducible random list-of-lists grid: random_grid(rows, cols, seed=0, density=0.5)."""
+
+    def make(rows: int, cols: int, seed: int = 0, density: float = 0.5) -> list[list[int]]:
+        rng = random.Random(seed)
+        return [[int(rng.random() < density) for _ in range(cols)] for _ in range(rows)]
+
+    return make
+
+
+@pytest.fixture
+def reference():
+    """Step a grid with life_functions.run_one_generation, the engine every other one must agree with."""
+
+    def run(grid: list[list[int]], generations: int) -> list[list[int]]:
+        for _ in range(generations):
+            grid = run_one_generation(grid)
+        return grid
+
+    return run
+
+
+@pytest.fixture
+def run_engine():
+    """Step a grid through a named engine from get_engine and convert the result back to lists."""
+
+    def run(engine: str, grid: list[list[int]], generations: int) -> list[list[int]]:
+        step, to_engine, from_engine, close = get_engine(engine)
+        state = to_engine(grid)
+        try:
+            for _ in range(generations):
+                state = step(state)
+            return from_engine(state)
+        finally:
+            close(state)
+
+    return run
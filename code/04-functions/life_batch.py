@@ -0,0 +1,97 @@
+import collections
+import dataclasses
+import hashlib
+import itertools
+import typing
+
+import life_functions
+
+# region Batch runner constants
+
+DEFAULT_HISTORY: typing.Final[int] = 4096  # how many past generations' hashes to remember
+DIGEST_SIZE: typing.Final[int] = 16
+
+# endregion
+
+
+@dataclasses.dataclass
+class HeadlessResult:
+    """What happened in a headless run.
+
+    `period` is 1 for a still life (including a dead board), p for a cycle of period p, and None if no repeat
+    was seen within the generations run (or the repeat was older than the hash history).
+    `detected_at` is the generation whose grid repeated an earlier one, `cycle_start` that earlier generation.
+    """
+
+    grid: list[list[int]]
+    generations_run: int
+    alive_counts: list[int]
+    period: int | None = None
+    detected_at: int | None = None
+    cycle_start: int | None = None
+
+    @property
+    def extinct(self) -> bool:
+        return self.alive_counts[-1] == 0
+
+    @property
+    def still_life(self) -> bool:
+        return self.period == 1
+
+
+def run_headless(
+    grid: list[list[int]],
+    generations: int,
+    engine: str = life_functions.DEFAULT_ENGINE,
+    history: int = DEFAULT_HISTORY,
+) -> HeadlessResult:
+    """Run up to `generations` generations with no rendering or sleeping, stopping early on a still life or cycle.
+
+    alive_counts[g] is the alive count at generation g, where generation 0 is the starting grid.
+    """
+    step, to_engine, from_engine, close = life_functions.get_engine(engine)
+    state = to_engine(grid)
+
+    try:
+        return _run(state, step, from_engine, generations, history)
+    finally:
+        close(state)
+
+
+def _run(state, step: typing.Callable, from_engine: typing.Callable, generations: int, history: int) -> HeadlessResult:
+    seen: dict[bytes, int] = {}
+    order: collections.deque[bytes] = collections.deque()
+    alive_counts: list[int] = []
+
+    for gen in range(generations + 1):
+        cells = cell_bytes(state)
+        alive_counts.append(cells.count(1))
+
+        digest = hashlib.blake2b(cells, digest_size=DIGEST_SIZE).digest()
+        if digest in seen:
+            first = seen[digest]
+            return HeadlessResult(from_engine(state), gen, alive_counts, gen - first, gen, first)
+
+        seen[digest] = gen
+        order.append(digest)
+        if len(order) > history:
+            del seen[order.popleft()]
+
+        if gen < generations:
+            state = step(state)
+
+    return HeadlessResult(from_engine(state), generations, alive_counts)
+
+
+def cell_bytes(state) -> bytes:
+    # One byte per cell, whatever engine the state belongs to.
+    if isinstance(state, list):
+        return bytes(itertools.chain.from_iterable(state))
+
+    import numpy as np
+
+    if hasattr(state, 'words'):  # life_bitboard.BitGrid
+        return np.unpackbits(state.words.view(np.uint8), axis=1, count=state.cols, bitorder='little').tobytes()
+    if hasattr(state, 'board'):  # life_tiles.TiledBoard, life_parallel.StripedLife
+        return np.ascontiguousarray(state.board, dtype=np.uint8).tobytes()
+    return np.ascontiguousarray(state, dtype=np.uint8).tobytes()
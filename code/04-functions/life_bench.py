@@ -0,0 +1,169 @@
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+import typing
+
+import numpy as np
+
+import life_batch
+import life_functions
+import life_hashlife
+
+# region Benchmark constants
+
+ENGINES: typing.Final[tuple[str, ...]] = ('python', 'B3/S23', 'hashlife', 'numpy', 'bitboard', 'tiles', 'parallel')
+SIZES: typing.Final[tuple[tuple[int, int], ...]] = ((20, 50), (256, 256), (1024, 1024), (8192, 8192))  # rows, cols
+DENSITIES: typing.Final[tuple[float, ...]] = (0.1, 0.5)
+GENERATIONS: typing.Final[tuple[int, ...]] = (10, 100)
+
+# The pure-Python engines would take hours on the biggest boards, so they are skipped above these sizes.
+ENGINE_MAX_CELLS: typing.Final[dict[str, int]] = {
+    'python': 256 * 256,
+    'B3/S23': 1024 * 1024,
+    'hashlife': 256 * 256,
+}
+# Results are checked against run_one_generation up to this size, and against the NumPy engine above it.
+REFERENCE_MAX_CELLS: typing.Final[int] = 256 * 256
+MEMORY_GENERATIONS: typing.Final[int] = 2  # tracemalloc slows allocation, so peak memory is measured separately
+
+# endregion
+
+
+def run_suite(
+    engines: typing.Iterable[str] = ENGINES,
+    sizes: typing.Iterable[tuple[int, int]] = SIZES,
+    densities: typing.Iterable[float] = DENSITIES,
+    generations_list: typing.Iterable[int] = GENERATIONS,
+    seed: int = 0,
+) -> dict:
+    """Time every engine over the matrix of sizes, densities and generation counts."""
+    results = []
+    for rows, cols in sizes:
+        for density in densities:
+            board = np.random.default_rng(seed).random((rows, cols)) < density
+            board = board.astype(np.uint8)
+            for generations in generations_list:
+                reference_name, reference = _reference(board, generations)
+                for engine in engines:
+                    if rows * cols > ENGINE_MAX_CELLS.get(engine, rows * cols):
+                        continue
+                    result = bench_engine(engine, board, generations)
+                    result.update(rows=rows, cols=cols, density=density, seed=seed)
+                    result['reference'] = reference_name
+                    result['matches_reference'] = result.pop('cells') == reference
+                    results.append(result)
+                    print(_format_result(result), flush=True)
+
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def bench_engine(engine: str, board: np.ndarray, generations: int) -> dict:
+    """Step one board with one engine; returns timing, peak memory and the final cells."""
+    grid = board.tolist() if engine in ENGINE_MAX_CELLS else board
+
+    seconds, cells = _timed_run(engine, grid, generations)
+
+    tracemalloc.start()
+    _timed_run(engine, grid, min(generations, MEMORY_GENERATIONS))
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'engine': engine,
+        'generations': generations,
+        'seconds': seconds,
+        'cells_per_second': board.size * generations / seconds if seconds else float('inf'),
+        'peak_bytes': peak_bytes,
+        'cells': cells,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Describe how cells/second changed for every benchmark present in both runs."""
+    previous = {_key(r): r for r in baseline['results']}
+    lines = []
+    for result in current['results']:
+        old = previous.get(_key(result))
+        if old:
+            ratio = result['cells_per_second'] / old['cells_per_second']
+            lines.append(f'{_label(result)}: {ratio:.2f}x baseline')
+    return lines
+
+
+def _timed_run(engine: str, grid, generations: int) -> tuple[float, bytes]:
+    if engine == 'hashlife':
+        t0 = time.perf_counter()
+        state = life_hashlife.advance(grid, generations, life_hashlife.HashLife())
+        return time.perf_counter() - t0, life_batch.cell_bytes(state)
+
+    step, to_engine, _, close = life_functions.get_engine(engine)
+    state = to_engine(grid)
+    try:
+        t0 = time.perf_counter()
+        for _ in range(generations):
+            state = step(state)
+        seconds = time.perf_counter() - t0
+        return seconds, life_batch.cell_bytes(state)
+    finally:
+        close(state)
+
+
+def _reference(board: np.ndarray, generations: int) -> tuple[str, bytes]:
+    engine = 'python' if board.size <= REFERENCE_MAX_CELLS else 'numpy'
+    grid = board.tolist() if engine == 'python' else board
+    return engine, _timed_run(engine, grid, generations)[1]
+
+
+def _key(result: dict) -> tuple:
+    return result['engine'], result['rows'], result['cols'], result['density'], result['generations']
+
+
+def _label(result: dict) -> str:
+    return f'{result["engine"]:>9} {result["rows"]}x{result["cols"]} d={result["density"]} g={result["generations"]}'
+
+
+def _format_result(result: dict) -> str:
+    check = 'ok' if result['matches_reference'] else f'MISMATCH vs {result["reference"]}'
+    return (
+        f'{_label(result)}: {result["cells_per_second"]:,.0f} cells/s, '
+        f'peak {result["peak_bytes"] / 1024**2:,.1f} MB, {check}'
+    )
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    rows, cols = text.lower().split('x')
+    return int(rows), int(cols)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark every Game of Life engine.')
+    parser.add_argument('--engines', nargs='+', default=ENGINES)
+    parser.add_argument('--sizes', nargs='+', type=_parse_size, default=SIZES, help='ROWSxCOLS, e.g. 1024x1024')
+    parser.add_argument('--densities', nargs='+', type=float, default=DENSITIES)
+    parser.add_argument('--generations', nargs='+', type=int, default=GENERATIONS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='life_bench.json', help='where to write the JSON results')
+    parser.add_argument('--baseline', help='an earlier JSON result file to compare against')
+    args = parser.parse_args()
+
+    report = run_suite(args.engines, args.sizes, args.densities, args.generations, args.seed)
+    with open(args.output, 'w') as f:
+        # Sorted keys and a fixed indent keep result files diffable between runs.
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f'Wrote {len(report["results"])} results to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print('\n'.join(compare(report, baseline)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import dataclasses
+import typing
+
+import numpy as np
+
+from life_functions import REVIVED_COUNT, SURVIVING_COUNTS
+
+# region Bitboard constants
+
+WORD_BITS: typing.Final[int] = 64
+WORD_DTYPE: typing.Final[np.dtype] = np.dtype('<u8')  # little-endian so bit j of a word is column j of the row
+COUNT_BITS: typing.Final[int] = 4  # enough bit-planes to hold neighbor counts 0..8
+
+# endregion
+
+
+@dataclasses.dataclass
+class BitGrid:
+    """A Life board stored one bit per cell, each row packed into uint64 words (bit 0 = leftmost column)."""
+
+    rows: int
+    cols: int
+    words: np.ndarray  # shape (rows, words_per_row), dtype WORD_DTYPE; bits past `cols` are always 0
+
+    @property
+    def words_per_row(self) -> int:
+        return self.words.shape[1]
+
+
+def words_for(cols: int) -> int:
+    return (cols + WORD_BITS - 1) // WORD_BITS
+
+
+def pack(grid: list[list[int]] | BitGrid) -> BitGrid:
+    """Convert a list-of-lists grid into a BitGrid; a BitGrid (e.g. loaded from a checkpoint) is returned as is."""
+    if isinstance(grid, BitGrid):
+        return grid
+    cells = np.asarray(grid, dtype=np.uint8)
+    rows, cols = cells.shape
+    padded = np.zeros((rows, words_for(cols) * WORD_BITS), dtype=np.uint8)
+    padded[:, :cols] = cells
+    packed = np.packbits(padded, axis=1, bitorder='little')
+    return BitGrid(rows, cols, packed.view(WORD_DTYPE))
+
+
+def unpack(board: BitGrid) -> list[list[int]]:
+    """Convert a BitGrid back into the list-of-lists grid used by display_grid."""
+    cells = np.unpackbits(board.words.view(np.uint8), axis=1, count=board.cols, bitorder='little')
+    return cells.astype(int).tolist()
+
+
+def initialize_bitgrid(cols: int, rows: int, seed: int | None = None) -> BitGrid:
+    """Create a random BitGrid directly from random words, without ever building the list-of-lists form."""
+    rng = np.random.default_rng(seed)
+    words = rng.integers(0, np.iinfo(np.uint64).max, size=(rows, words_for(cols)), dtype=np.uint64, endpoint=True)
+    words = words.astype(WORD_DTYPE, copy=False)
+    words[:, -1] &= _last_word_mask(cols)
+    return BitGrid(rows, cols, words)
+
+
+def count_alive_cells(board: BitGrid) -> int:
+    """Count live cells with a popcount over the packed words."""
+    return int(np.bitwise_count(board.words).sum())
+
+
+def run_one_generation(board: BitGrid) -> BitGrid:
+    """Step a BitGrid one generation, 64 cells per word operation, with the same wraparound as run_one_generation."""
+    words = board.words
+    west = _shift_from_west(words, board.cols)
+    east = _shift_from_east(words, board.cols)
+
+    # The 8 neighbors of every cell, as whole-board bit-planes: left/right in this row, and all three above/below.
+    neighbors = [west, east]
+    for plane in (west, words, east):
+        neighbors.append(np.roll(plane, 1, axis=0))  # row above
+        neighbors.append(np.roll(plane, -1, axis=0))  # row below
+
+    count_bits = _bitwise_sum(neighbors)
+
+    born = _count_equals_any(count_bits, {REVIVED_COUNT})
+    survives = _count_equals_any(count_bits, SURVIVING_COUNTS)
+    new_words = (born & ~words) | (survives & words)
+    new_words[:, -1] &= _last_word_mask(board.cols)
+    return BitGrid(board.rows, board.cols, new_words)
+
+
+def _shift_from_west(words: np.ndarray, cols: int) -> np.ndarray:
+    # Result bit j holds the cell at column j - 1; column 0 wraps around to column cols - 1.
+    one = WORD_DTYPE.type(1)
+    shifted = words << one
+    shifted[:, 1:] |= words[:, :-1] >> WORD_DTYPE.type(WORD_BITS - 1)
+    last_col = WORD_DTYPE.type((cols - 1) % WORD_BITS)
+    shifted[:, 0] |= (words[:, -1] >> last_col) & one
+    return shifted
+
+
+def _shift_from_east(words: np.ndarray, cols: int) -> np.ndarray:
+    # Result bit j holds the cell at column j + 1; column cols - 1 wraps around to column 0.
+    one = WORD_DTYPE.type(1)
+    shifted = words >> one
+    shifted[:, :-1] |= words[:, 1:] << WORD_DTYPE.type(WORD_BITS - 1)
+    last_col = WORD_DTYPE.type((cols - 1) % WORD_BITS)
+    shifted[:, -1] |= (words[:, 0] & one) << last_col
+    return shifted
+
+
+def _bitwise_sum(planes: list[np.ndarray]) -> list[np.ndarray]:
+    # Ripple-carry add each one-bit plane into COUNT_BITS accumulator planes, for all 64 cells of a word at once.
+    count_bits = [np.zeros_like(planes[0]) for _ in range(COUNT_BITS)]
+    for plane in planes:
+        carry = plane
+        for i in range(COUNT_BITS):
+            count_bits[i], carry = count_bits[i] ^ carry, count_bits[i] & carry
+    return count_bits
+
+
+def _count_equals_any(count_bits: list[np.ndarray], counts: typing.Iterable[int]) -> np.ndarray:
+    result = np.zeros_like(count_bits[0])
+    for count in counts:
+        match = ~np.zeros_like(count_bits[0])
+        for i, bit in enumerate(count_bits):
+            match &= bit if (count >> i) & 1 else ~bit
+        result |= match
+    return result
+
+
+def _last_word_mask(cols: int) -> np.uint64:
+    used = cols % WORD_BITS or WORD_BITS
+    return WORD_DTYPE.type((1 << used) - 1)
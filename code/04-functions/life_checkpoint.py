@@ -0,0 +1,239 @@
+import contextlib
+import os
+import re
+import struct
+import typing
+
+import numpy as np
+
+import life_bitboard
+from life_bitboard import BitGrid
+
+# region Checkpoint constants
+
+PACKED_MAGIC: typing.Final[bytes] = b'LIFEBIT1'
+PACKED_HEADER: typing.Final[struct.Struct] = struct.Struct('<8sQQQ')  # magic, rows, cols, generation
+PACKED_DATA_OFFSET: typing.Final[int] = 64  # the words start on a cache-line boundary after the header
+SPARSE_DENSITY: typing.Final[float] = 0.05  # below this alive fraction, save() picks RLE
+RLE_LINE_LENGTH: typing.Final[int] = 70
+RLE_HEADER: typing.Final[re.Pattern] = re.compile(r'x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)')
+RLE_TOKEN: typing.Final[re.Pattern] = re.compile(r'(\d*)([bo$!])')
+
+# endregion
+
+
+def save(path: str, grid: list[list[int]] | BitGrid, generation: int = 0) -> str:
+    """Checkpoint a grid, as RLE if it is sparse or bit-packed if it is dense. Returns the format used."""
+    if isinstance(grid, BitGrid):
+        alive, cells = life_bitboard.count_alive_cells(grid), grid.rows * grid.cols
+    else:
+        alive, cells = sum(sum(row) for row in grid), len(grid) * len(grid[0])
+
+    if alive < SPARSE_DENSITY * cells:
+        save_rle(path, grid, generation)
+        return 'rle'
+    save_packed(path, grid, generation)
+    return 'packed'
+
+
+def load_grid(path: str) -> tuple[list[list[int]], int]:
+    """Load either checkpoint format as a list-of-lists grid plus the generation it was saved at."""
+    if is_packed(path):
+        board, generation = load_packed(path)
+        return life_bitboard.unpack(board), generation
+    return load_rle(path)
+
+
+def is_packed(path: str) -> bool:
+    """Whether a checkpoint file is bit-packed (and so can be loaded straight into a BitGrid) rather than RLE."""
+    with open(path, 'rb') as f:
+        return f.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+
+
+# region RLE (sparse boards)
+
+
+def save_rle(path: str, grid: list[list[int]] | BitGrid, generation: int = 0) -> None:
+    """Write a grid in the standard Life RLE format, with a toroidal rule so other tools wrap it like we do.
+
+    A BitGrid is read row by row from its words, so a huge sparse board is never unpacked as a whole.
+    """
+    if isinstance(grid, BitGrid):
+        rows, cols = grid.rows, grid.cols
+        row_runs = (_packed_runs(words, cols) for words in grid.words)
+    else:
+        rows, cols = len(grid), len(grid[0])
+        row_runs = (_runs(row) for row in grid)
+
+    tokens = []
+    current_row = 0
+    for i, runs in enumerate(row_runs):
+        if not runs:
+            continue
+        if i > current_row:
+            tokens.append(_run_token(i - current_row, '$'))
+            current_row = i
+        tokens.extend(_run_token(count, 'o' if cell else 'b') for cell, count in runs)
+    tokens.append('!')
+
+    lines = [f'#C generation {generation}', f'x = {cols}, y = {rows}, rule = B3/S23:T{cols},{rows}']
+    line = ''
+    for token in tokens:
+        if len(line) + len(token) > RLE_LINE_LENGTH:
+            lines.append(line)
+            line = ''
+        line += token
+    lines.append(line)
+    with _open_atomically(path) as f:
+        f.write(('\n'.join(lines) + '\n').encode('ascii'))
+
+
+def load_rle(path: str, packed: bool = False) -> tuple[list[list[int]] | BitGrid, int]:
+    """Read an RLE checkpoint. With packed=True, alive runs are set straight into a BitGrid's words."""
+    rows, cols, generation, body = _read_rle(path)
+
+    if packed:
+        words = np.zeros((rows, life_bitboard.words_for(cols)), dtype=life_bitboard.WORD_DTYPE)
+        for i, j, count in _alive_runs(body):
+            _set_bits(words[i], j, count)
+        return BitGrid(rows, cols, words), generation
+
+    grid = [[0] * cols for _ in range(rows)]
+    for i, j, count in _alive_runs(body):
+        grid[i][j : j + count] = [1] * count
+    return grid, generation
+
+
+def _read_rle(path: str) -> tuple[int, int, int, str]:
+    # (rows, cols, generation, run tokens) from an RLE file.
+    generation = 0
+    size = None
+    body = []
+    with open(path, encoding='ascii') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#C generation'):
+                generation = int(line.split()[-1])
+            elif line.startswith('#') or not line:
+                continue
+            elif size is None:
+                match = RLE_HEADER.match(line)
+                if not match:
+                    raise ValueError(f'{path} is not a Life RLE file: missing "x = ..., y = ..." header')
+                size = int(match.group(1)), int(match.group(2))
+            else:
+                body.append(line)
+    if size is None:
+        raise ValueError(f'{path} is not a Life RLE file: missing "x = ..., y = ..." header')
+    cols, rows = size
+    return rows, cols, generation, ''.join(body)
+
+
+def _alive_runs(body: str) -> typing.Iterator[tuple[int, int, int]]:
+    # (row, first column, length) of every run of live cells.
+    i = j = 0
+    for count_text, tag in RLE_TOKEN.findall(body):
+        count = int(count_text or 1)
+        if tag == '!':
+            break
+        if tag == '$':
+            i, j = i + count, 0
+        else:
+            if tag == 'o':
+                yield i, j, count
+            j += count
+
+
+def _set_bits(row_words: np.ndarray, start: int, count: int) -> None:
+    # Set columns start .. start + count - 1 of one BitGrid row, a word at a time.
+    stop = start + count
+    for w in range(start // life_bitboard.WORD_BITS, (stop - 1) // life_bitboard.WORD_BITS + 1):
+        word_start = w * life_bitboard.WORD_BITS
+        lo, hi = max(start, word_start) - word_start, min(stop, word_start + life_bitboard.WORD_BITS) - word_start
+        row_words[w] |= life_bitboard.WORD_DTYPE.type(((1 << (hi - lo)) - 1) << lo)
+
+
+def _runs(row: list[int]) -> list[tuple[int, int]]:
+    # (cell, count) runs, without the trailing dead run that RLE leaves implicit.
+    runs: list[tuple[int, int]] = []
+    for cell in row:
+        if runs and runs[-1][0] == cell:
+            runs[-1] = (cell, runs[-1][1] + 1)
+        else:
+            runs.append((cell, 1))
+    if runs and runs[-1][0] == 0:
+        runs.pop()
+    return runs
+
+
+def _packed_runs(row_words: np.ndarray, cols: int) -> list[tuple[int, int]]:
+    # The same runs as _runs, for one BitGrid row: only this row is unpacked, and only where it has live cells.
+    if not row_words.any():
+        return []
+    cells = np.unpackbits(row_words.view(np.uint8), count=cols, bitorder='little')
+    # Where the cells flip between dead and alive; live runs start at the even edges and end at the odd ones.
+    edges = np.flatnonzero(np.diff(cells, prepend=0, append=0))
+    runs: list[tuple[int, int]] = []
+    end = 0
+    for start, stop in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+        if start > end:
+            runs.append((0, start - end))
+        runs.append((1, stop - start))
+        end = stop
+    return runs
+
+
+def _run_token(count: int, tag: str) -> str:
+    return tag if count == 1 else f'{count}{tag}'
+
+
+# endregion
+
+# region Bit-packed (dense and huge boards)
+
+
+def save_packed(path: str, grid: list[list[int]] | BitGrid, generation: int = 0) -> None:
+    """Write a fixed header followed by the BitGrid's raw words, so the file can be memory-mapped back."""
+    board = grid if isinstance(grid, BitGrid) else life_bitboard.pack(grid)
+    header = PACKED_HEADER.pack(PACKED_MAGIC, board.rows, board.cols, generation).ljust(PACKED_DATA_OFFSET, b'\0')
+
+    with _open_atomically(path) as f:
+        f.write(header)
+        # Row by row, so a multi-gigabyte (possibly itself memory-mapped) board never needs a second full copy.
+        for row in board.words:
+            f.write(row.astype(life_bitboard.WORD_DTYPE, copy=False).tobytes())
+
+
+def load_packed(path: str, mmap: bool = True) -> tuple[BitGrid, int]:
+    """Open a bit-packed checkpoint. With mmap=True, words are read lazily from disk as they are touched."""
+    with open(path, 'rb') as f:
+        magic, rows, cols, generation = PACKED_HEADER.unpack(f.read(PACKED_HEADER.size))
+    if magic != PACKED_MAGIC:
+        raise ValueError(f'{path} is not a bit-packed Life checkpoint')
+
+    shape = (rows, life_bitboard.words_for(cols))
+    if mmap:
+        words = np.memmap(path, dtype=life_bitboard.WORD_DTYPE, mode='r', offset=PACKED_DATA_OFFSET, shape=shape)
+    else:
+        words = np.fromfile(path, dtype=life_bitboard.WORD_DTYPE, offset=PACKED_DATA_OFFSET).reshape(shape)
+    return BitGrid(rows, cols, words), generation
+
+
+# endregion
+
+
+@contextlib.contextmanager
+def _open_atomically(path: str) -> typing.Iterator[typing.BinaryIO]:
+    # A crash mid-write leaves the previous checkpoint in place rather than a truncated one.
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+            # Make sure the data is on disk before the rename, or a power cut could leave an empty file behind it.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
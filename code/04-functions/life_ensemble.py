@@ -0,0 +1,101 @@
+import dataclasses
+import hashlib
+import typing
+
+import numpy as np
+
+import life_batch
+import life_numpy
+
+# region Ensemble constants
+
+DEFAULT_DENSITY: typing.Final[float] = 0.5  # initialize_grid's random.randint(0, 1) is alive half the time
+NOT_REACHED: typing.Final[int] = -1
+
+# endregion
+
+
+@dataclasses.dataclass
+class EnsembleResult:
+    """Per-member statistics of an ensemble run; row m of every array belongs to member m.
+
+    alive_counts[m, g] is member m's alive count at generation g (generation 0 is the starting board).
+    Once a member repeats an earlier board it is no longer stepped, and its counts are continued by its cycle.
+    stabilized_at[m] is the first generation of that cycle, like HeadlessResult.cycle_start, and the repeat was
+    noticed at stabilized_at[m] + period[m].
+    extinct_at, stabilized_at and period are NOT_REACHED (-1) where that never happened within the run.
+    """
+
+    alive_counts: np.ndarray
+    extinct_at: np.ndarray
+    stabilized_at: np.ndarray
+    period: np.ndarray
+    seeds: list[np.random.SeedSequence]
+
+    @property
+    def members(self) -> int:
+        return len(self.alive_counts)
+
+
+def member_boards(
+    members: int, rows: int, cols: int, seed: int | None = None, density: float = DEFAULT_DENSITY
+) -> tuple[np.ndarray, list[np.random.SeedSequence]]:
+    """Random starting boards, stacked as (members, rows, cols), each from its own reproducible RNG stream.
+
+    Member m's board depends only on `seed` and m, so any member can be rerun alone from seeds[m].
+    """
+    seeds = np.random.SeedSequence(seed).spawn(members)
+    boards = np.empty((members, rows, cols), dtype=np.uint8)
+    for m, member_seed in enumerate(seeds):
+        boards[m] = np.random.default_rng(member_seed).random((rows, cols)) < density
+    return boards, seeds
+
+
+def run_ensemble(
+    members: int,
+    rows: int = 20,
+    cols: int = 50,
+    generations: int = 100,
+    seed: int | None = None,
+    density: float = DEFAULT_DENSITY,
+    history: int = life_batch.DEFAULT_HISTORY,
+) -> EnsembleResult:
+    """Run many random boards side by side, stepping all still-changing members in one array operation."""
+    boards, seeds = member_boards(members, rows, cols, seed, density)
+
+    alive_counts = np.zeros((members, generations + 1), dtype=np.int64)
+    stabilized_at = np.full(members, NOT_REACHED)
+    period = np.full(members, NOT_REACHED)
+    histories: list[dict[bytes, int]] = [{} for _ in range(members)]
+    active = np.arange(members)
+
+    for gen in range(generations + 1):
+        alive_counts[active, gen] = boards.sum(axis=(1, 2))
+
+        still_active = []
+        for k, m in enumerate(active):
+            digest = hashlib.blake2b(boards[k].tobytes(), digest_size=life_batch.DIGEST_SIZE).digest()
+            seen = histories[m]
+            if digest in seen:
+                stabilized_at[m] = seen[digest]
+                period[m] = gen - seen[digest]
+                seen.clear()
+                continue
+            seen[digest] = gen
+            if len(seen) > history:
+                del seen[next(iter(seen))]  # dicts keep insertion order, so this is the oldest generation
+            still_active.append(k)
+
+        if not still_active or gen == generations:
+            break
+        boards = life_numpy.run_one_generation(boards[still_active])
+        active = active[still_active]
+
+    # Members that settled into a cycle repeat it for the rest of the run.
+    for m in np.nonzero(stabilized_at != NOT_REACHED)[0]:
+        for gen in range(stabilized_at[m] + period[m] + 1, generations + 1):
+            alive_counts[m, gen] = alive_counts[m, gen - period[m]]
+
+    extinct = alive_counts == 0
+    extinct_at = np.where(extinct.any(axis=1), extinct.argmax(axis=1), NOT_REACHED)
+    return EnsembleResult(alive_counts, extinct_at, stabilized_at, period, seeds)
@@ -15,15 +15,112 @@ SURVIVING_COUNTS: typing.Final[set[int]] = {2, 3}
 IS_ALIVE: typing.Final[int] = 1
 REVIVED_COUNT: typing.Final[int] = 3
 
+DEFAULT_ENGINE: typing.Final[str] = 'python'
+
 # endregion
 
 
-def game_of_life(rows: int = 20, cols: int = 50, generations: int = 100, delay: float = 0.1):
-    grid = initialize_grid(cols, rows)
-    for gen in range(1, generations + 1):
-        display_grid(cols, gen, generations, grid)
-        grid = run_one_generation(grid)
-        time.sleep(delay)
+def game_of_life(
+    rows: int = 20,
+    cols: int = 50,
+    generations: int = 100,
+    delay: float = 0.1,
+    engine: str = DEFAULT_ENGINE,
+    renderer=None,
+    headless: bool = False,
+    resume_from: str | None = None,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int = 0,
+):
+    # Pass a life_render.TerminalRenderer to draw only changed cells (and skip frames) instead of display_grid.
+    # With headless=True nothing is drawn or slept, and the run stops early once the board repeats itself.
+    # resume_from continues from a life_checkpoint file, and checkpoint_path is rewritten every checkpoint_every
+    # generations. The bitboard engine reads and writes both checkpoint formats straight from its packed words.
+    start_gen = 1
+    if resume_from:
+        import life_checkpoint
+
+        if engine == 'bitboard':  # pack() passes the BitGrid through
+            if life_checkpoint.is_packed(resume_from):
+                grid, start_gen = life_checkpoint.load_packed(resume_from)  # memory-mapped
+            else:
+                grid, start_gen = life_checkpoint.load_rle(resume_from, packed=True)
+            rows, cols = grid.rows, grid.cols
+        else:
+            grid, start_gen = life_checkpoint.load_grid(resume_from)
+            rows, cols = len(grid), len(grid[0])
+    else:
+        grid = initialize_grid(cols, rows)
+
+    if headless:
+        import life_batch
+
+        return life_batch.run_headless(grid, generations - start_gen + 1, engine)
+
+    step, to_engine, from_engine, close = get_engine(engine)
+    grid = to_engine(grid)
+    try:
+        for gen in range(start_gen, generations + 1):
+            if renderer is None:
+                display_grid(cols, gen, generations, from_engine(grid))
+            elif renderer.frame_due() or gen == generations:
+                renderer.render(from_engine(grid), gen, generations)
+            grid = step(grid)
+            if checkpoint_path and checkpoint_every and (gen + 1) % checkpoint_every == 0:
+                import life_checkpoint
+
+                # A BitGrid is saved from its words in either format, without unpacking the whole board.
+                life_checkpoint.save(checkpoint_path, grid if engine == 'bitboard' else from_engine(grid), gen + 1)
+            time.sleep(delay)
+    finally:
+        close(grid)
+        if renderer is not None:
+            renderer.close()  # restores the cursor, even if the run is interrupted
+
+
+def get_engine(name: str) -> tuple[typing.Callable, typing.Callable, typing.Callable, typing.Callable]:
+    # Returns (step, to_engine, from_engine, close). The grid conversions let every engine share
+    # initialize_grid and display_grid, which work on the list-of-lists form. Call close on the last state
+    # when done, even on errors: it releases whatever to_engine acquired (worker processes, shared memory).
+    if name == 'python':
+        return run_one_generation, _identity, _identity, _release
+    if name == 'numpy':
+        import life_numpy
+
+        return life_numpy.run_one_generation, life_numpy.to_array, life_numpy.from_array, _release
+    if name == 'bitboard':
+        import life_bitboard
+
+        return life_bitboard.run_one_generation, life_bitboard.pack, life_bitboard.unpack, _release
+    if name == 'tiles':
+        import life_tiles
+
+        return life_tiles.run_one_generation, life_tiles.to_tiles, life_tiles.from_tiles, _release
+    if name == 'parallel':
+        import life_parallel
+
+        return (
+            life_parallel.run_one_generation,
+            life_parallel.to_striped,
+            life_parallel.from_striped,
+            life_parallel.close_striped,
+        )
+
+    # Anything else may be a Life-like rule in B/S notation, e.g. 'B36/S23', run through a precomputed lookup table.
+    import life_rules
+
+    if life_rules.RULE_PATTERN.match(name):
+        return life_rules.make_step(life_rules.parse_rule(name)), _identity, _identity, _release
+
+    raise ValueError(f'Unknown Life engine: {name!r}')
+
+
+def _identity(grid):
+    return grid
+
+
+def _release(grid):
+    pass  # nothing to release for engines that only hold memory
 
 
 def run_one_generation(grid):
@@ -56,6 +153,13 @@ def run_one_generation(grid):
     return grid
 
 
+def advance(grid: list[list[int]], generations: int) -> list[list[int]]:
+    # Jump many generations at once with HashLife instead of calling run_one_generation in a loop.
+    import life_hashlife
+
+    return life_hashlife.advance(grid, generations)
+
+
 def display_grid(cols, gen, generations, grid):
     alive_count = count_alive_cells(grid)
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -0,0 +1,191 @@
+import typing
+
+from life_functions import REVIVED_COUNT, SURVIVING_COUNTS
+
+# region HashLife constants
+
+DEFAULT_MAX_NODES: typing.Final[int] = 2_000_000
+
+# endregion
+
+
+class Node:
+    """A canonical quadtree node: a 2^level x 2^level square built from four 2^(level-1) quadrants.
+
+    Nodes are hash-consed by HashLife.join, so equal squares are the same object and can be compared by identity.
+    `results` memoizes step(): it maps j to the center square advanced 2^j generations.
+    """
+
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population', 'results')
+
+    def __init__(self, nw, ne, sw, se, level: int, population: int):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = level
+        self.population = population
+        self.results: dict[int, Node] = {}
+
+
+DEAD_CELL: typing.Final[Node] = Node(None, None, None, None, 0, 0)
+LIVE_CELL: typing.Final[Node] = Node(None, None, None, None, 0, 1)
+
+
+class HashLife:
+    """A HashLife universe: a hash-consing node table plus memoized future results.
+
+    The node table never holds more than `max_nodes` nodes: when join() would go past that, even in the middle of
+    a jump, the table and every memoized result are flushed. Nodes the jump in progress still holds stay alive
+    through its references but are no longer canonical, so some squares may briefly exist twice. Results stay
+    correct, only recomputed, and a jump that needs far more than `max_nodes` nodes gets slower rather than bigger.
+    """
+
+    def __init__(self, max_nodes: int = DEFAULT_MAX_NODES):
+        self.max_nodes = max_nodes
+        self.table: dict[tuple[Node, Node, Node, Node], Node] = {}
+        self.collections = 0
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        node = self.table.get(key)
+        if node is None:
+            if len(self.table) >= self.max_nodes:
+                self.collect_garbage()
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw, ne, sw, se, nw.level + 1, population)
+            self.table[key] = node
+        return node
+
+    def collect_garbage(self) -> None:
+        # Results link nodes to their futures, which would keep flushed nodes alive, so they go too.
+        for node in self.table.values():
+            node.results.clear()
+        self.table.clear()
+        self.collections += 1
+
+    def center(self, node: Node) -> Node:
+        # The middle 2^(level-1) square of a node, with no time passing.
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def step(self, node: Node, j: int) -> Node:
+        """Return the center half of `node` advanced 2^j generations (requires j <= node.level - 2)."""
+        result = node.results.get(j)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._step_base(node)
+        else:
+            result = self._step_recursive(node, j)
+
+        node.results[j] = result
+        return result
+
+    def _step_recursive(self, node: Node, j: int) -> Node:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        # Nine overlapping sub-squares, each half the size of `node`.
+        n00, n01, n02 = nw, self.join(nw.ne, ne.nw, nw.se, ne.sw), ne
+        n10 = self.join(nw.sw, nw.se, sw.nw, sw.ne)
+        n11 = self.join(nw.se, ne.sw, sw.ne, se.nw)
+        n12 = self.join(ne.sw, ne.se, se.nw, se.ne)
+        n20, n21, n22 = sw, self.join(sw.ne, se.nw, sw.se, se.sw), se
+
+        if j == node.level - 2:
+            # Full speed: advance 2^(j-1) generations twice.
+            first, second_j = lambda n: self.step(n, j - 1), j - 1
+        else:
+            # Slower than full speed: take the centers now and spend all 2^j generations in the second pass.
+            first, second_j = self.center, j
+
+        r00, r01, r02 = first(n00), first(n01), first(n02)
+        r10, r11, r12 = first(n10), first(n11), first(n12)
+        r20, r21, r22 = first(n20), first(n21), first(n22)
+
+        return self.join(
+            self.step(self.join(r00, r01, r10, r11), second_j),
+            self.step(self.join(r01, r02, r11, r12), second_j),
+            self.step(self.join(r10, r11, r20, r21), second_j),
+            self.step(self.join(r11, r12, r21, r22), second_j),
+        )
+
+    def _step_base(self, node: Node) -> Node:
+        # A 4x4 square stepped one generation by brute force, giving its 2x2 center.
+        cells = _read_region(node, 0, 0, 4, 4)
+        new_cells = []
+        for i in (1, 2):
+            for j in (1, 2):
+                neighbor_count = sum(
+                    cells[i + di][j + dj] for di in (-1, 0, 1) for dj in (-1, 0, 1) if not (di == 0 and dj == 0)
+                )
+                if cells[i][j]:
+                    alive = neighbor_count in SURVIVING_COUNTS
+                else:
+                    alive = neighbor_count == REVIVED_COUNT
+                new_cells.append(LIVE_CELL if alive else DEAD_CELL)
+        return self.join(*new_cells)
+
+    def tile(self, grid: list[list[int]], level: int) -> Node:
+        """Build the 2^level square at the origin of the plane tiled with copies of `grid` (a torus unrolled)."""
+        rows, cols = len(grid), len(grid[0])
+        # Squares at the same position modulo the grid size are identical, so only those positions are built.
+        previous = {(y, x): LIVE_CELL if grid[y][x] else DEAD_CELL for y in range(rows) for x in range(cols)}
+        for lvl in range(1, level + 1):
+            half = 1 << (lvl - 1)
+            size = 1 << lvl
+            current = {}
+            for y in {(k * size) % rows for k in range(min(rows, (1 << level) // size))}:
+                for x in {(k * size) % cols for k in range(min(cols, (1 << level) // size))}:
+                    current[(y, x)] = self.join(
+                        previous[(y, x)],
+                        previous[(y, (x + half) % cols)],
+                        previous[((y + half) % rows, x)],
+                        previous[((y + half) % rows, (x + half) % cols)],
+                    )
+            previous = current
+        return previous[(0, 0)]
+
+
+def advance(grid: list[list[int]], generations: int, universe: HashLife | None = None) -> list[list[int]]:
+    """Advance a grid any number of generations, with the same wraparound as run_one_generation.
+
+    The torus is unrolled into the infinite plane tiled with copies of the grid, and HashLife jumps it forward
+    2^j generations at a time, once per set bit of `generations`. Pass the same `universe` to later calls to
+    reuse its memoized results; without one, a fresh universe is built and freed along with its nodes.
+    """
+    universe = universe or HashLife()
+    rows, cols = len(grid), len(grid[0])
+    grid = [list(row) for row in grid]
+
+    remaining = generations
+    while remaining > 0:
+        j = remaining.bit_length() - 1
+        # The jump needs a node 4x the light cone of 2^j generations, and a center big enough to hold the grid.
+        level = max(j + 2, max(rows, cols).bit_length() + 1, 2)
+        result = universe.step(universe.tile(grid, level), j)
+
+        # The result covers the tiled plane from offset 2^(level-2); read one grid-sized window and undo the offset.
+        offset = 1 << (level - 2)
+        window = _read_region(result, 0, 0, rows, cols)
+        grid = [[window[(r - offset) % rows][(c - offset) % cols] for c in range(cols)] for r in range(rows)]
+        remaining -= 1 << j
+
+    return grid
+
+
+def _read_region(node: Node, y0: int, x0: int, height: int, width: int) -> list[list[int]]:
+    cells = [[0] * width for _ in range(height)]
+    _fill_region(node, 0, 0, y0, x0, height, width, cells)
+    return cells
+
+
+def _fill_region(node: Node, top: int, left: int, y0: int, x0: int, height: int, width: int, cells) -> None:
+    size = 1 << node.level
+    if node.population == 0 or top >= y0 + height or left >= x0 + width or top + size <= y0 or left + size <= x0:
+        return
+    if node.level == 0:
+        cells[top - y0][left - x0] = 1
+        return
+    half = size // 2
+    _fill_region(node.nw, top, left, y0, x0, height, width, cells)
+    _fill_region(node.ne, top, left + half, y0, x0, height, width, cells)
+    _fill_region(node.sw, top + half, left, y0, x0, height, width, cells)
+    _fill_region(node.se, top + half, left + half, y0, x0, height, width, cells)
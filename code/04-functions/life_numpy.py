@@ -0,0 +1,51 @@
+import typing
+
+import numpy as np
+
+from life_functions import REVIVED_COUNT, SURVIVING_COUNTS
+
+# region NumPy engine constants
+
+NEIGHBOR_OFFSETS: typing.Final[tuple[tuple[int, int], ...]] = tuple(
+    (di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if not (di == 0 and dj == 0)
+)
+
+# endregion
+
+
+def to_array(grid: list[list[int]]) -> np.ndarray:
+    """Convert a list-of-lists grid into a uint8 NumPy array."""
+    return np.asarray(grid, dtype=np.uint8)
+
+
+def from_array(board: np.ndarray) -> list[list[int]]:
+    """Convert a NumPy board back into the list-of-lists grid used by life_functions."""
+    return board.astype(int).tolist()
+
+
+def count_neighbors(board: np.ndarray) -> np.ndarray:
+    """Count live neighbors for every cell at once, wrapping around the edges like run_one_generation.
+
+    The board is the last two axes, so a stack of boards (e.g. shape (members, rows, cols)) works too.
+    """
+    rows, cols = board.shape[-2:]
+    # Pad one cell of wraparound on every side so each neighbor offset is a plain slice of the same array.
+    padded = np.pad(board, [(0, 0)] * (board.ndim - 2) + [(1, 1), (1, 1)], mode='wrap')
+    counts = np.zeros(board.shape, dtype=np.uint8)
+    for di, dj in NEIGHBOR_OFFSETS:
+        counts += padded[..., 1 + di : 1 + di + rows, 1 + dj : 1 + dj + cols]
+    return counts
+
+
+def run_one_generation(board: np.ndarray) -> np.ndarray:
+    """Step a NumPy board one generation using whole-array neighbor counts and Conway's rules."""
+    board = np.asarray(board, dtype=np.uint8)
+    neighbor_count = count_neighbors(board)
+
+    alive = board == 1
+    survives = np.zeros(board.shape, dtype=bool)
+    for count in SURVIVING_COUNTS:
+        survives |= neighbor_count == count
+    survives &= alive
+    revived = ~alive & (neighbor_count == REVIVED_COUNT)
+    return (survives | revived).astype(np.uint8)
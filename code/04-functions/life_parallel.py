@@ -0,0 +1,156 @@
+import multiprocessing
+import os
+import typing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import life_numpy
+
+# region Parallel engine constants
+
+STOP: typing.Final[int] = -1  # sent as the generation count to shut the workers down
+LIVENESS_POLL: typing.Final[float] = 0.1  # seconds between checks that the workers are still alive
+JOIN_TIMEOUT: typing.Final[float] = 5.0  # seconds to wait for workers to exit before terminating them
+
+# endregion
+
+
+class StripedLife:
+    """A Life board stepped by worker processes, one horizontal stripe each.
+
+    The board lives in two shared-memory buffers (current and next). Each generation a worker reads its stripe
+    plus the one-row halos above and below from the current buffer, writes the stripe into the next buffer, and
+    waits at a barrier so no one reads a buffer before every stripe is written. Nothing is pickled per step.
+
+    The workers and shared memory stay around until close() (or the end of a with block). If a worker dies,
+    run() raises RuntimeError instead of waiting for it forever.
+    """
+
+    def __init__(self, grid: list[list[int]], workers: int | None = None):
+        board = life_numpy.to_array(grid)
+        self.shape = board.shape
+        rows = self.shape[0]
+        workers = max(1, min(workers or os.cpu_count() or 1, rows))
+
+        self.generation = 0
+        self._buffers = [shared_memory.SharedMemory(create=True, size=board.nbytes) for _ in range(2)]
+        self._boards = [np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf) for shm in self._buffers]
+        self._boards[0][:] = board
+
+        self._generations = multiprocessing.Value('q', 0)
+        # One start token per worker per run, and one done token back from each, so the parent can keep
+        # checking on the workers while it waits (a barrier would just hang if one of them died).
+        self._start = multiprocessing.Semaphore(0)
+        self._done = multiprocessing.Semaphore(0)
+        step = multiprocessing.Barrier(workers)
+
+        bounds = np.linspace(0, rows, workers + 1, dtype=int)
+        self._workers = [
+            multiprocessing.Process(
+                target=_stripe_worker,
+                args=(
+                    [shm.name for shm in self._buffers],
+                    self.shape,
+                    int(r0),
+                    int(r1),
+                    self._generations,
+                    self._start,
+                    self._done,
+                    step,
+                ),
+                daemon=True,
+            )
+            for r0, r1 in zip(bounds[:-1], bounds[1:])
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def board(self) -> np.ndarray:
+        return self._boards[self.generation % 2]
+
+    def run(self, generations: int = 1) -> 'StripedLife':
+        """Step every stripe `generations` times in parallel and return self."""
+        if generations <= 0:
+            return self
+        if not self._workers:
+            raise RuntimeError('This StripedLife has been closed')
+        self._generations.value = generations
+        for _ in self._workers:
+            self._start.release()
+        for _ in self._workers:
+            while not self._done.acquire(timeout=LIVENESS_POLL):
+                if not all(worker.is_alive() for worker in self._workers):
+                    self.close()
+                    raise RuntimeError('A Life worker process died')
+        self.generation += generations
+        return self
+
+    def to_grid(self) -> list[list[int]]:
+        return life_numpy.from_array(self.board)
+
+    def close(self) -> None:
+        if self._workers:
+            self._generations.value = STOP
+            for _ in self._workers:
+                self._start.release()
+            for worker in self._workers:
+                worker.join(JOIN_TIMEOUT)
+                if worker.is_alive():  # e.g. stuck at the step barrier after another worker died
+                    worker.terminate()
+                    worker.join()
+            self._workers = []
+        self._boards = []
+        for shm in self._buffers:
+            shm.close()
+            shm.unlink()
+        self._buffers = []
+
+    def __enter__(self) -> 'StripedLife':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def to_striped(grid: list[list[int]]) -> StripedLife:
+    return StripedLife(grid)
+
+
+def run_one_generation(striped: StripedLife) -> StripedLife:
+    return striped.run(1)
+
+
+def from_striped(striped: StripedLife) -> list[list[int]]:
+    return striped.to_grid()
+
+
+def close_striped(striped: StripedLife) -> None:
+    striped.close()
+
+
+def _stripe_worker(names, shape, r0, r1, generations, start, done, step) -> None:
+    buffers = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf) for shm in buffers]
+    # Our stripe plus one halo row above and below, wrapping around like run_one_generation.
+    halo_rows = np.arange(r0 - 1, r1 + 1) % shape[0]
+    current = 0
+    try:
+        while True:
+            start.acquire()
+            count = generations.value
+            if count == STOP:
+                break
+            for _ in range(count):
+                neighborhood = boards[current][halo_rows]
+                boards[1 - current][r0:r1] = life_numpy.run_one_generation(neighborhood)[1:-1]
+                # Wait for every stripe to be written before anyone reads the new buffer.
+                step.wait()
+                current = 1 - current
+            done.release()
+    finally:
+        # The arrays must let go of the shared buffers before they can be closed.
+        del boards
+        for shm in buffers:
+            shm.close()
@@ -0,0 +1,88 @@
+import sys
+import time
+import typing
+
+from life_functions import ALIVE_CHAR, DEAD_CHAR, HEADER_COL, RESET_COL, count_alive_cells
+
+# region Renderer constants
+
+CLEAR_SCREEN: typing.Final[str] = '\033[2J'
+HIDE_CURSOR: typing.Final[str] = '\033[?25l'
+SHOW_CURSOR: typing.Final[str] = '\033[?25h'
+CLEAR_TO_LINE_END: typing.Final[str] = '\033[K'
+GRID_TOP_ROW: typing.Final[int] = 2  # terminal row of the first grid row; the header sits on row 1
+
+# endregion
+
+
+def move_to(row: int, col: int) -> str:
+    # ANSI cursor position, 1-based.
+    return f'\033[{row};{col}H'
+
+
+class TerminalRenderer:
+    """Draws Life frames by updating only the cells that changed since the last drawn frame.
+
+    Each frame is built into one string and written with a single write, so there is no clear-screen flicker.
+    With `target_fps`, frame_due() says to skip frames arriving sooner than 1/target_fps after the last drawn
+    one, so the simulation can run as fast as it likes while the screen updates at a steady rate.
+    """
+
+    def __init__(self, out: typing.TextIO = sys.stdout, target_fps: float | None = None):
+        self.out = out
+        self.min_frame_interval = 1 / target_fps if target_fps else 0.0
+        self.previous: list[list[int]] | None = None
+        self.last_frame_time: float | None = None
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    def frame_due(self) -> bool:
+        """Is it time to draw another frame? Counts the frame as skipped if not."""
+        if self.last_frame_time is None or time.perf_counter() - self.last_frame_time >= self.min_frame_interval:
+            return True
+        self.frames_skipped += 1
+        return False
+
+    def render(self, grid: list[list[int]], gen: int, generations: int) -> None:
+        """Draw a frame, writing only the cells that differ from the previous one."""
+        cols = len(grid[0])
+        parts = []
+        if self.previous is None or len(self.previous) != len(grid) or len(self.previous[0]) != cols:
+            parts.append(HIDE_CURSOR + CLEAR_SCREEN)
+            self.previous = None
+
+        alive_count = count_alive_cells(grid)
+        header = f' Game of Life | Generation {gen}/{generations} | Alive: {alive_count} '.center(cols, '=')
+        parts.append(move_to(1, 1) + HEADER_COL + header + RESET_COL + CLEAR_TO_LINE_END)
+
+        for i, row in enumerate(grid):
+            old_row = self.previous[i] if self.previous is not None else None
+            if old_row == row:
+                continue
+            parts.extend(_changed_runs(i, row, old_row))
+
+        parts.append(move_to(GRID_TOP_ROW + len(grid), 1))
+        self.out.write(''.join(parts))
+        self.out.flush()
+
+        self.previous = [list(row) for row in grid]
+        self.last_frame_time = time.perf_counter()
+        self.frames_drawn += 1
+
+    def close(self) -> None:
+        self.out.write(SHOW_CURSOR)
+        self.out.flush()
+
+
+def _changed_runs(i: int, row: list[int], old_row: list[int] | None) -> typing.Iterator[str]:
+    # One cursor move per run of adjacent changed cells; writing the run's characters advances the cursor itself.
+    j = 0
+    cols = len(row)
+    while j < cols:
+        if old_row is not None and row[j] == old_row[j]:
+            j += 1
+            continue
+        start = j
+        while j < cols and (old_row is None or row[j] != old_row[j]):
+            j += 1
+        yield move_to(GRID_TOP_ROW + i, start + 1) + ''.join(ALIVE_CHAR if cell else DEAD_CHAR for cell in row[start:j])
@@ -0,0 +1,86 @@
+import dataclasses
+import re
+import typing
+
+from life_functions import REVIVED_COUNT, SURVIVING_COUNTS
+
+# region Rule constants
+
+NEIGHBORHOOD_BITS: typing.Final[int] = 9
+CENTER_BIT: typing.Final[int] = 4  # bits 6-8 are the left column, 3-5 the middle, 0-2 the right; top to bottom
+WINDOW_MASK: typing.Final[int] = (1 << NEIGHBORHOOD_BITS) - 1
+RULE_PATTERN: typing.Final[re.Pattern] = re.compile(r'^B([0-8]*)/S([0-8]*)$', re.IGNORECASE)
+
+# endregion
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    """A Life-like rule: dead cells with a count in `born` come alive, live cells with a count in `survive` stay."""
+
+    born: frozenset[int]
+    survive: frozenset[int]
+
+    def __str__(self) -> str:
+        return f'B{"".join(map(str, sorted(self.born)))}/S{"".join(map(str, sorted(self.survive)))}'
+
+
+CONWAY: typing.Final[Rule] = Rule(frozenset({REVIVED_COUNT}), frozenset(SURVIVING_COUNTS))
+
+
+def parse_rule(text: str) -> Rule:
+    """Parse B/S notation, e.g. 'B3/S23' (Conway) or 'B36/S23' (HighLife)."""
+    match = RULE_PATTERN.match(text.strip())
+    if not match:
+        raise ValueError(f'Not a B/S rule: {text!r}')
+    born, survive = match.groups()
+    return Rule(frozenset(map(int, born)), frozenset(map(int, survive)))
+
+
+def compile_rule(rule: Rule) -> bytes:
+    """Build the 512-entry lookup table: entry n is the next state of the center of packed neighborhood n."""
+    table = bytearray(1 << NEIGHBORHOOD_BITS)
+    for index in range(len(table)):
+        alive = (index >> CENTER_BIT) & 1
+        neighbor_count = index.bit_count() - alive
+        table[index] = neighbor_count in (rule.survive if alive else rule.born)
+    return bytes(table)
+
+
+def run_one_generation(grid: list[list[int]], rule: Rule = CONWAY) -> list[list[int]]:
+    """Step a list-of-lists grid one generation under any B/S rule, with run_one_generation's wraparound."""
+    return _step(grid, _compiled(rule))
+
+
+def make_step(rule: Rule) -> typing.Callable[[list[list[int]]], list[list[int]]]:
+    table = _compiled(rule)
+    return lambda grid: _step(grid, table)
+
+
+def _step(grid: list[list[int]], table: bytes) -> list[list[int]]:
+    rows = len(grid)
+
+    new_grid: list[list[int]] = []
+    for i in range(rows):
+        up, row, down = grid[(i - 1) % rows], grid[i], grid[(i + 1) % rows]
+        # Pack each column of the 3-row band into 3 bits once; every window below reuses them.
+        columns = [(a << 2) | (b << 1) | c for a, b, c in zip(up, row, down)]
+
+        # Slide a 9-bit window across the band: shift out the leftmost column, shift in the next one.
+        window = (columns[-1] << 3) | columns[0]
+        new_row = []
+        for column in columns[1:] + columns[:1]:
+            window = ((window << 3) | column) & WINDOW_MASK
+            new_row.append(table[window])
+        new_grid.append(new_row)
+    return new_grid
+
+
+_tables: dict[Rule, bytes] = {}
+
+
+def _compiled(rule: Rule) -> bytes:
+    table = _tables.get(rule)
+    if table is None:
+        table = _tables[rule] = compile_rule(rule)
+    return table
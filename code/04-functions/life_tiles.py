@@ -0,0 +1,84 @@
+import dataclasses
+import typing
+
+import numpy as np
+
+import life_numpy
+
+# region Tiled engine constants
+
+DEFAULT_TILE_SIZE: typing.Final[int] = 32
+
+# endregion
+
+
+@dataclasses.dataclass
+class TiledBoard:
+    """A NumPy board split into square tiles, remembering which tiles changed in the last generation.
+
+    Only tiles that changed, plus their 8 neighbors, can change in the next generation, so stepping
+    skips everything else. Two buffers are swapped each generation instead of copying the board.
+    """
+
+    board: np.ndarray
+    back: np.ndarray
+    tile_size: int
+    dirty: np.ndarray  # bool, one entry per tile: did this tile change in the last generation?
+    tiles_touched: int = 0  # how many tiles the last call to run_one_generation recomputed
+
+    @property
+    def tile_count(self) -> int:
+        return self.dirty.size
+
+
+def to_tiles(grid: list[list[int]], tile_size: int = DEFAULT_TILE_SIZE) -> TiledBoard:
+    """Convert a list-of-lists grid into a TiledBoard with every tile marked dirty."""
+    # Copy, since stepping writes into both buffers and must not touch the caller's grid.
+    board = life_numpy.to_array(grid).copy()
+    rows, cols = board.shape
+    tile_shape = (-(-rows // tile_size), -(-cols // tile_size))
+    return TiledBoard(board, board.copy(), tile_size, np.ones(tile_shape, dtype=bool))
+
+
+def from_tiles(tiled: TiledBoard) -> list[list[int]]:
+    """Convert a TiledBoard back into the list-of-lists grid used by display_grid."""
+    return life_numpy.from_array(tiled.board)
+
+
+def run_one_generation(tiled: TiledBoard) -> TiledBoard:
+    """Step a TiledBoard one generation, recomputing only the tiles next to last generation's changes.
+
+    The TiledBoard is updated in place and returned, so it can be used like the other engines' grids.
+    """
+    board, back, size = tiled.board, tiled.back, tiled.tile_size
+    rows, cols = board.shape
+
+    active = _dilate(tiled.dirty)
+    changed = np.zeros_like(tiled.dirty)
+    for ti, tj in zip(*np.nonzero(active)):
+        r0, c0 = ti * size, tj * size
+        r1, c1 = min(r0 + size, rows), min(c0 + size, cols)
+
+        # The tile plus a one-cell wraparound border is all we need to step the tile itself.
+        row_idx = np.arange(r0 - 1, r1 + 1) % rows
+        col_idx = np.arange(c0 - 1, c1 + 1) % cols
+        neighborhood = board[np.ix_(row_idx, col_idx)]
+        new_tile = life_numpy.run_one_generation(neighborhood)[1:-1, 1:-1]
+
+        back[r0:r1, c0:c1] = new_tile
+        changed[ti, tj] = not np.array_equal(new_tile, board[r0:r1, c0:c1])
+
+    # Inactive tiles did not change last generation, so `back` (two generations old) already holds their values.
+    tiled.board, tiled.back = back, board
+    tiled.dirty = changed
+    tiled.tiles_touched = len(active.nonzero()[0])
+    return tiled
+
+
+def _dilate(dirty: np.ndarray) -> np.ndarray:
+    # Mark each dirty tile's 8 neighbors too, wrapping around like the board itself.
+    active = dirty.copy()
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            active |= np.roll(dirty, (di, dj), axis=(0, 1))
+    return active
@@ -0,0 +1,61 @@
+"""Unit tests for the life_batch module."""
+
+import os
+
+import pytest
+from life_batch import cell_bytes, run_headless
+import life_functions
+
+BLINKER = [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+BLOCK = [[0, 0, 0, 0], [0, 1, 1, 0], [0, 1, 1, 0], [0, 0, 0, 0]]
+
+
+class TestRunHeadless:
+    """Tests for the headless runner's still-life and cycle detection."""
+
+    @pytest.mark.parametrize('engine', ['python', 'numpy', 'bitboard', 'parallel'])
+    def test_blinker_has_period_two(self, engine):
+        """Test that an oscillator is reported as a cycle, starting from generation 0."""
+        result = run_headless(BLINKER, 100, engine)
+        assert result.period == 2
+        assert result.cycle_start == 0
+        assert result.detected_at == 2
+        assert result.generations_run == 2
+        assert result.alive_counts == [3, 3, 3]
+
+    def test_block_is_a_still_life(self):
+        """Test that a board that never changes stops after one generation."""
+        result = run_headless(BLOCK, 100)
+        assert result.still_life
+        assert result.grid == BLOCK
+
+    def test_dead_board_is_extinct(self):
+        """Test that an empty board is both extinct and a still life."""
+        result = run_headless([[0] * 4 for _ in range(4)], 100)
+        assert result.extinct
+        assert result.still_life
+
+    def test_no_repeat_runs_every_generation(self):
+        """Test that a run with no repeat in range steps exactly the generations asked for."""
+        grid = [[0] * 8 for _ in range(8)]
+        for i, j in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:  # a glider, which repeats only after 32 generations
+            grid[i][j] = 1
+        result = run_headless(grid, 10)
+        assert result.period is None
+        assert result.generations_run == 10
+        assert len(result.alive_counts) == 11
+
+    def test_parallel_engine_releases_shared_memory(self):
+        """Test that the striped engine's shared memory is gone once the run returns."""
+        if not os.path.isdir('/dev/shm'):
+            pytest.skip('needs /dev/shm to inspect shared memory')
+        before = set(os.listdir('/dev/shm'))
+        run_headless(BLINKER, 10, 'parallel')
+        assert set(os.listdir('/dev/shm')) <= before
+
+    def test_cell_bytes_agree_across_engines(self):
+        """Test that every engine's state serializes to the same cell bytes."""
+        expected = bytes(cell for row in BLINKER for cell in row)
+        for engine in ['python', 'numpy', 'bitboard', 'tiles']:
+            _, to_engine, _, _ = life_functions.get_engine(engine)
+            assert cell_bytes(to_engine(BLINKER)) == expected
@@ -0,0 +1,22 @@
+"""Unit tests for the life_bench module."""
+
+from life_bench import ENGINES, compare, run_suite
+
+
+class TestLifeBench:
+    """Tests for the engine benchmark suite."""
+
+    def test_every_engine_matches_the_reference(self):
+        """Test that a small suite runs every engine and each agrees with the reference."""
+        report = run_suite(sizes=[(7, 65)], densities=[0.3], generations_list=[3])
+        assert [r['engine'] for r in report['results']] == list(ENGINES)
+        assert all(r['matches_reference'] for r in report['results'])
+        assert all(r['cells_per_second'] > 0 for r in report['results'])
+
+    def test_compare_reports_ratio_to_baseline(self):
+        """Test that compare() describes each shared result's speed relative to the baseline."""
+        result = {'engine': 'numpy', 'rows': 8, 'cols': 8, 'density': 0.5, 'generations': 10}
+        current = {'results': [result | {'cells_per_second': 300.0}]}
+        baseline = {'results': [result | {'cells_per_second': 100.0}]}
+        assert compare(current, baseline) == ['    numpy 8x8 d=0.5 g=10: 3.00x baseline']
+        assert compare(current, {'results': []}) == []
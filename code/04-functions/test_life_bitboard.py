@@ -0,0 +1,40 @@
+"""Unit tests for the life_bitboard module."""
+
+import numpy as np
+import pytest
+import life_bitboard
+
+# Widths just under, at and past one and two 64-bit words.
+SHAPES = [(1, 1), (7, 63), (7, 64), (7, 65), (5, 130)]
+GENERATIONS = 12
+
+
+class TestBitboard:
+    """Tests for the bit-packed BitGrid engine."""
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_matches_reference(self, random_grid, reference, run_engine, rows, cols):
+        """Test that word-parallel stepping agrees with the reference, wraparound included."""
+        grid = random_grid(rows, cols)
+        assert run_engine('bitboard', grid, GENERATIONS) == reference(grid, GENERATIONS)
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_pack_round_trip(self, random_grid, rows, cols):
+        """Test that pack and unpack are inverses and count the same live cells."""
+        grid = random_grid(rows, cols)
+        board = life_bitboard.pack(grid)
+        assert board.words_per_row == life_bitboard.words_for(cols)
+        assert life_bitboard.unpack(board) == grid
+        assert life_bitboard.count_alive_cells(board) == sum(map(sum, grid))
+
+    def test_padding_bits_stay_clear(self):
+        """Test that bits past the last column are never set, even by random boards and stepping."""
+        board = life_bitboard.initialize_bitgrid(65, 9, seed=1)
+        for _ in range(5):
+            assert not np.any(board.words[:, -1] >> np.uint64(1))
+            board = life_bitboard.run_one_generation(board)
+
+    def test_pack_passes_a_bitgrid_through(self, random_grid):
+        """Test that packing an already packed board returns it unchanged."""
+        board = life_bitboard.pack(random_grid(4, 70))
+        assert life_bitboard.pack(board) is board
@@ -0,0 +1,120 @@
+"""Unit tests for the life_checkpoint module."""
+
+import os
+import random
+
+import numpy as np
+import pytest
+import life_bitboard
+import life_checkpoint
+import life_functions
+
+
+def random_grid(rows: int, cols: int, density: float, seed: int = 0) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[int(rng.random() < density) for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'board.life')
+
+
+class TestCheckpoint:
+    """Tests for saving and restoring Life grids."""
+
+    @pytest.mark.parametrize('rows,cols', [(1, 1), (7, 65), (5, 130)])
+    def test_rle_round_trip(self, path, rows, cols):
+        """Test that an RLE checkpoint restores the same grid and generation."""
+        grid = random_grid(rows, cols, 0.3)
+        life_checkpoint.save_rle(path, grid, 42)
+        assert life_checkpoint.load_grid(path) == (grid, 42)
+
+    @pytest.mark.parametrize('rows,cols', [(1, 1), (7, 65), (5, 130)])
+    @pytest.mark.parametrize('mmap', [True, False])
+    def test_packed_round_trip(self, path, rows, cols, mmap):
+        """Test that a bit-packed checkpoint restores the same board, memory-mapped or read in full."""
+        grid = random_grid(rows, cols, 0.5)
+        life_checkpoint.save_packed(path, grid, 7)
+        board, generation = life_checkpoint.load_packed(path, mmap=mmap)
+        assert generation == 7
+        assert life_bitboard.unpack(board) == grid
+        assert np.array_equal(board.words, life_bitboard.pack(grid).words)
+
+    @pytest.mark.parametrize('rows,cols', [(1, 1), (7, 65), (5, 130)])
+    def test_bitgrid_rle_matches_list_rle(self, path, tmp_path, rows, cols):
+        """Test that RLE written from a BitGrid's words is byte-for-byte the RLE written from its lists."""
+        grid = random_grid(rows, cols, 0.3)
+        life_checkpoint.save_rle(path, life_bitboard.pack(grid), 5)
+        list_path = str(tmp_path / 'lists.rle')
+        life_checkpoint.save_rle(list_path, grid, 5)
+        with open(path, 'rb') as packed, open(list_path, 'rb') as lists:
+            assert packed.read() == lists.read()
+
+    @pytest.mark.parametrize('rows,cols', [(1, 1), (7, 65), (5, 130)])
+    def test_rle_loads_into_bitgrid(self, path, rows, cols):
+        """Test that loading RLE with packed=True fills the same words as packing the loaded lists."""
+        grid = random_grid(rows, cols, 0.3)
+        life_checkpoint.save_rle(path, grid, 9)
+        board, generation = life_checkpoint.load_rle(path, packed=True)
+        assert generation == 9
+        assert (board.rows, board.cols) == (rows, cols)
+        assert np.array_equal(board.words, life_bitboard.pack(grid).words)
+
+    def test_save_picks_format_by_density(self, path):
+        """Test that sparse grids are saved as RLE and dense ones bit-packed."""
+        assert life_checkpoint.save(path, random_grid(20, 20, 0.01), 1) == 'rle'
+        assert not life_checkpoint.is_packed(path)
+        assert life_checkpoint.save(path, random_grid(20, 20, 0.5), 1) == 'packed'
+        assert life_checkpoint.is_packed(path)
+        assert life_checkpoint.save(path, life_bitboard.pack(random_grid(20, 20, 0.01)), 1) == 'rle'
+        assert not life_checkpoint.is_packed(path)
+
+    def test_failed_write_keeps_previous_checkpoint(self, path):
+        """Test that an error mid-write leaves the old file in place and no temporary file behind."""
+        grid = random_grid(8, 8, 0.5)
+        life_checkpoint.save_packed(path, grid, 3)
+        with pytest.raises(RuntimeError), life_checkpoint._open_atomically(path) as f:
+            f.write(b'partial')
+            raise RuntimeError('disk full')
+        assert life_checkpoint.load_grid(path) == (grid, 3)
+        assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+    def test_not_rle_raises_error(self, path):
+        """Test that a file that is neither format raises ValueError."""
+        with open(path, 'w') as f:
+            f.write('hello\n')
+        with pytest.raises(ValueError, match='not a Life RLE file'):
+            life_checkpoint.load_grid(path)
+
+    @pytest.mark.parametrize('engine', ['python', 'bitboard'])
+    @pytest.mark.parametrize('density', [0.03, 0.5])
+    def test_resume_continues_the_run(self, path, engine, density):
+        """Test that resuming from an RLE or packed checkpoint ends on the same board as an uninterrupted run."""
+        grid = random_grid(16, 70, density)
+        life_checkpoint.save(path, grid, 1)  # game_of_life numbers the starting board generation 1
+        whole = life_functions.game_of_life(generations=30, engine=engine, headless=True, resume_from=path)
+
+        life_functions.game_of_life(
+            generations=10,
+            delay=0,
+            engine=engine,
+            renderer=_SilentRenderer(),
+            resume_from=path,
+            checkpoint_path=path,
+            checkpoint_every=5,
+        )
+        assert life_checkpoint.load_grid(path)[1] == 10
+        rest = life_functions.game_of_life(generations=30, engine=engine, headless=True, resume_from=path)
+        assert rest.grid == whole.grid
+
+
+class _SilentRenderer:
+    def frame_due(self) -> bool:
+        return False
+
+    def render(self, grid, gen, generations) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
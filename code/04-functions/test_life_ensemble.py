@@ -0,0 +1,48 @@
+"""Unit tests for the life_ensemble module."""
+
+import numpy as np
+from life_batch import run_headless
+from life_ensemble import NOT_REACHED, member_boards, run_ensemble
+import life_numpy
+
+MEMBERS = 12
+ROWS, COLS = 10, 12
+GENERATIONS = 150
+
+
+class TestEnsemble:
+    """Tests for the batched ensemble runner."""
+
+    def test_members_are_reproducible_alone(self):
+        """Test that a member's board depends only on the seed, not on how many members there are."""
+        boards, _ = member_boards(MEMBERS, ROWS, COLS, seed=7)
+        fewer, _ = member_boards(3, ROWS, COLS, seed=7)
+        assert np.array_equal(boards[:3], fewer)
+
+    def test_members_match_headless_runs(self):
+        """Test that each member's counts, cycle start and period match running it on its own."""
+        boards, _ = member_boards(MEMBERS, ROWS, COLS, seed=7)
+        result = run_ensemble(MEMBERS, ROWS, COLS, GENERATIONS, seed=7)
+        for m in range(MEMBERS):
+            alone = run_headless(life_numpy.from_array(boards[m]), GENERATIONS, 'numpy')
+            assert list(result.alive_counts[m, : len(alone.alive_counts)]) == alone.alive_counts
+            if alone.period is None:
+                assert result.stabilized_at[m] == NOT_REACHED
+            else:
+                assert result.stabilized_at[m] == alone.cycle_start
+                assert result.period[m] == alone.period
+
+    def test_cycles_continue_to_the_end_of_the_run(self):
+        """Test that a settled member's counts keep following its cycle after it stops being stepped."""
+        result = run_ensemble(MEMBERS, ROWS, COLS, GENERATIONS, seed=7)
+        for m in np.nonzero(result.stabilized_at != NOT_REACHED)[0]:
+            start, period = result.stabilized_at[m], result.period[m]
+            counts = result.alive_counts[m]
+            assert all(counts[g] == counts[g - period] for g in range(start + period, GENERATIONS + 1))
+
+    def test_extinct_members(self):
+        """Test that extinct_at is the first generation with no live cells."""
+        result = run_ensemble(MEMBERS, ROWS, COLS, GENERATIONS, seed=7, density=0.05)
+        for m in range(MEMBERS):
+            zeros = np.nonzero(result.alive_counts[m] == 0)[0]
+            assert result.extinct_at[m] == (zeros[0] if len(zeros) else NOT_REACHED)
@@ -0,0 +1,32 @@
+"""Unit tests for the life_hashlife module."""
+
+import pytest
+from life_hashlife import HashLife, advance
+
+SHAPES = [(1, 1), (7, 65), (5, 130), (20, 50)]
+GLIDER = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+
+class TestHashLife:
+    """Tests for the HashLife engine."""
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_jump_matches_reference(self, random_grid, reference, rows, cols):
+        """Test that one jump of many generations agrees with stepping one at a time."""
+        grid = random_grid(rows, cols)
+        assert advance(grid, 37) == reference(grid, 37)
+
+    def test_glider_returns_home(self):
+        """Test that a glider on a 6x6 torus is back where it started after 24 generations."""
+        grid = [[0] * 6 for _ in range(6)]
+        for i, row in enumerate(GLIDER):
+            grid[i][: len(row)] = row
+        assert advance(grid, 24) == grid
+
+    def test_node_cap_is_respected(self, random_grid, reference):
+        """Test that a small node cap forces collections but never changes the answer."""
+        grid = random_grid(16, 16, seed=3)
+        universe = HashLife(max_nodes=500)
+        assert advance(grid, 200, universe) == reference(grid, 200)
+        assert len(universe.table) <= 500
+        assert universe.collections > 0
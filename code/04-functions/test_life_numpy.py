@@ -0,0 +1,44 @@
+"""Unit tests for the life_numpy engine and the get_engine registry."""
+
+import numpy as np
+import pytest
+import life_numpy
+from life_functions import get_engine
+
+# Odd shapes: a single cell that is its own neighbor, and widths just past one and two 64-bit words.
+SHAPES = [(1, 1), (7, 65), (5, 130), (20, 50)]
+GENERATIONS = 12
+
+
+class TestNumpyEngine:
+    """The NumPy engine must step a board exactly like run_one_generation, wraparound included."""
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_matches_reference(self, random_grid, reference, run_engine, rows, cols):
+        """Test that the engine agrees with the reference on random boards."""
+        grid = random_grid(rows, cols)
+        assert run_engine('numpy', grid, GENERATIONS) == reference(grid, GENERATIONS)
+
+    def test_neighbor_counts_wrap_around(self):
+        """Test that a corner cell counts the cells in the other three corners as neighbors."""
+        board = np.zeros((4, 5), dtype=np.uint8)
+        board[0, 0] = 1
+        counts = life_numpy.count_neighbors(board)
+        assert counts[3, 4] == counts[0, 1] == counts[1, 0] == 1
+        assert counts[0, 0] == 0
+
+    def test_leaves_the_input_grid_alone(self, random_grid, run_engine):
+        """Test that converting and stepping never writes into the caller's grid."""
+        grid = random_grid(7, 65)
+        original = [row[:] for row in grid]
+        run_engine('numpy', grid, 3)
+        assert grid == original
+
+
+class TestGetEngine:
+    """Tests for looking engines up by name."""
+
+    def test_unknown_engine_raises_error(self):
+        """Test that an unrecognized engine name raises ValueError."""
+        with pytest.raises(ValueError, match='Unknown Life engine'):
+            get_engine('nope')
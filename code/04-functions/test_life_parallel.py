@@ -0,0 +1,40 @@
+"""Unit tests for the life_parallel module."""
+
+import pytest
+from life_functions import get_engine
+from life_parallel import StripedLife
+
+SHAPES = [(1, 1), (7, 65), (20, 50)]
+GENERATIONS = 12
+
+
+class TestParallel:
+    """Tests for the striped multi-process engine."""
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_matches_reference(self, random_grid, reference, run_engine, rows, cols):
+        """Test that the engine agrees with the reference."""
+        grid = random_grid(rows, cols)
+        assert run_engine('parallel', grid, GENERATIONS) == reference(grid, GENERATIONS)
+
+    def test_more_workers_than_rows(self, random_grid, reference):
+        """Test that asking for more workers than there are rows still steps every row."""
+        grid = random_grid(3, 10)
+        with StripedLife(grid, workers=8) as striped:
+            assert striped.run(GENERATIONS).to_grid() == reference(grid, GENERATIONS)
+
+    def test_dead_worker_raises_error(self, random_grid):
+        """Test that a worker that dies makes run() fail instead of hanging."""
+        with StripedLife(random_grid(8, 8), workers=2) as striped:
+            striped._workers[0].kill()
+            striped._workers[0].join()
+            with pytest.raises(RuntimeError, match='worker process died'):
+                striped.run(5)
+
+    def test_engine_close_stops_workers(self, random_grid):
+        """Test that the close function from get_engine shuts down the worker processes."""
+        _, to_engine, _, close = get_engine('parallel')
+        striped = to_engine(random_grid(8, 8))
+        workers = list(striped._workers)
+        close(striped)
+        assert not any(worker.is_alive() for worker in workers)
@@ -0,0 +1,64 @@
+"""Unit tests for the life_render module."""
+
+import io
+
+import life_functions
+from life_render import CLEAR_SCREEN, HIDE_CURSOR, SHOW_CURSOR, TerminalRenderer
+
+
+def blank(rows: int, cols: int) -> list[list[int]]:
+    return [[0] * cols for _ in range(rows)]
+
+
+class TestTerminalRenderer:
+    """Tests for the differential terminal renderer."""
+
+    def test_first_frame_clears_and_draws_live_cells(self):
+        """Test that the first frame clears the screen, hides the cursor and draws every live cell."""
+        out = io.StringIO()
+        grid = blank(3, 4)
+        grid[1][2] = 1
+        TerminalRenderer(out).render(grid, 1, 10)
+        frame = out.getvalue()
+        assert frame.startswith(HIDE_CURSOR + CLEAR_SCREEN)
+        assert frame.count(life_functions.ALIVE_CHAR) == 1
+
+    def test_unchanged_frame_redraws_only_the_header(self):
+        """Test that a frame identical to the last one writes no cells."""
+        out = io.StringIO()
+        renderer = TerminalRenderer(out)
+        grid = blank(3, 4)
+        grid[0][0] = 1
+        renderer.render(grid, 1, 10)
+        out.seek(0)
+        out.truncate()
+        renderer.render(grid, 2, 10)
+        assert CLEAR_SCREEN not in out.getvalue()
+        assert life_functions.ALIVE_CHAR not in out.getvalue()
+
+    def test_only_changed_cells_are_written(self):
+        """Test that a frame writes just the cells that differ from the previous frame."""
+        out = io.StringIO()
+        renderer = TerminalRenderer(out)
+        grid = blank(3, 4)
+        renderer.render(grid, 1, 10)
+        grid = blank(3, 4)
+        grid[2][3] = 1
+        out.seek(0)
+        out.truncate()
+        renderer.render(grid, 2, 10)
+        assert out.getvalue().count(life_functions.ALIVE_CHAR) == 1
+
+    def test_frames_are_skipped_above_target_fps(self):
+        """Test that frame_due() skips frames that arrive too soon after the last one."""
+        renderer = TerminalRenderer(io.StringIO(), target_fps=0.001)
+        assert renderer.frame_due()
+        renderer.render(blank(2, 2), 1, 10)
+        assert not renderer.frame_due()
+        assert renderer.frames_skipped == 1
+
+    def test_game_of_life_closes_the_renderer(self):
+        """Test that game_of_life shows the cursor again once the run is over."""
+        out = io.StringIO()
+        life_functions.game_of_life(5, 5, 3, 0, renderer=TerminalRenderer(out))
+        assert out.getvalue().endswith(SHOW_CURSOR)
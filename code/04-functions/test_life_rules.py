@@ -0,0 +1,38 @@
+"""Unit tests for the life_rules module."""
+
+import pytest
+import life_rules
+from life_rules import parse_rule
+
+SHAPES = [(1, 1), (7, 65), (20, 50)]
+GENERATIONS = 12
+
+
+class TestRules:
+    """Tests for B/S rule parsing and stepping."""
+
+    def test_parse_rule(self):
+        """Test that a B/S rule string parses into its birth and survival counts and prints back."""
+        rule = parse_rule('B36/S23')
+        assert rule.born == {3, 6}
+        assert rule.survive == {2, 3}
+        assert str(rule) == 'B36/S23'
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_conway_matches_reference(self, random_grid, reference, run_engine, rows, cols):
+        """Test that the B3/S23 engine agrees with the reference."""
+        grid = random_grid(rows, cols)
+        assert run_engine('B3/S23', grid, GENERATIONS) == reference(grid, GENERATIONS)
+
+    def test_highlife_step(self, random_grid):
+        """Test one HighLife step against a direct count of each cell's neighbors."""
+        grid = random_grid(7, 65, seed=2)
+        rows, cols = len(grid), len(grid[0])
+        result = life_rules.run_one_generation(grid, parse_rule('B36/S23'))
+        for i in range(rows):
+            for j in range(cols):
+                count = sum(
+                    grid[(i + di) % rows][(j + dj) % cols] for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj
+                )
+                expected = count in {2, 3} if grid[i][j] else count in {3, 6}
+                assert result[i][j] == int(expected)
@@ -0,0 +1,43 @@
+"""Unit tests for the life_tiles module."""
+
+import pytest
+import life_tiles
+
+SHAPES = [(1, 1), (7, 65), (5, 130), (20, 50)]
+GENERATIONS = 12
+
+
+class TestTiles:
+    """Tests for the dirty-tile engine."""
+
+    @pytest.mark.parametrize('rows,cols', SHAPES)
+    def test_matches_reference(self, random_grid, reference, run_engine, rows, cols):
+        """Test that the engine agrees with the reference with its default tile size."""
+        grid = random_grid(rows, cols)
+        assert run_engine('tiles', grid, GENERATIONS) == reference(grid, GENERATIONS)
+
+    @pytest.mark.parametrize('tile_size', [1, 3, 4])
+    def test_small_tiles_match_reference(self, random_grid, reference, tile_size):
+        """Test that tiles smaller than the board, including ones that do not divide it, step correctly."""
+        grid = random_grid(7, 65, seed=1)
+        tiled = life_tiles.to_tiles(grid, tile_size)
+        for _ in range(GENERATIONS):
+            tiled = life_tiles.run_one_generation(tiled)
+        assert life_tiles.from_tiles(tiled) == reference(grid, GENERATIONS)
+
+    def test_still_board_touches_no_tiles(self):
+        """Test that once nothing changes, no tiles are recomputed."""
+        grid = [[0] * 16 for _ in range(16)]
+        for i, j in [(1, 1), (1, 2), (2, 1), (2, 2)]:  # a block, which never changes
+            grid[i][j] = 1
+        tiled = life_tiles.to_tiles(grid, 4)
+        for _ in range(3):
+            tiled = life_tiles.run_one_generation(tiled)
+        assert tiled.tiles_touched == 0
+
+    def test_leaves_the_input_grid_alone(self, random_grid, run_engine):
+        """Test that stepping writes into the engine's own buffers, not the caller's grid."""
+        grid = random_grid(7, 65)
+        original = [row[:] for row in grid]
+        run_engine('tiles', grid, 3)
+        assert grid == original
@@ -0,0 +1,86 @@
+import asyncio
+import itertools
+import typing
+
+from mathfib import fibonacci, multiples_of
+
+DEFAULT_BATCH_SIZE: typing.Final[int] = 1_000
+DEFAULT_YIELD_EVERY: typing.Final[int] = 10_000
+DEFAULT_QUEUE_SIZE: typing.Final[int] = 8
+
+T = typing.TypeVar('T')
+_DONE = object()
+
+
+async def afibonacci(
+    batch_size: int = DEFAULT_BATCH_SIZE, yield_every: int = DEFAULT_YIELD_EVERY
+) -> typing.AsyncGenerator[list[int], None]:
+    # Async version of fibonacci() that hands out lists of batch_size numbers at a time,
+    # and lets the event loop run other tasks after every yield_every numbers.
+    numbers = fibonacci()
+    since_pause = 0
+    while True:
+        batch = list(itertools.islice(numbers, batch_size))
+        yield batch
+        since_pause = await _pause_if_due(since_pause + len(batch), yield_every)
+
+
+async def amultiples_of(
+    batches: typing.AsyncIterable[typing.Iterable[int]],
+    number: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    yield_every: int = DEFAULT_YIELD_EVERY,
+) -> typing.AsyncGenerator[list[int], None]:
+    # Async version of multiples_of() for a stream of batches (e.g. from afibonacci),
+    # regrouped into batches of batch_size multiples. Any leftover partial batch is sent when the stream ends.
+    pending: list[int] = []
+    since_pause = 0
+    async for batch in batches:
+        pending.extend(multiples_of(batch, number))
+        while len(pending) >= batch_size:
+            yield pending[:batch_size]
+            del pending[:batch_size]
+        since_pause = await _pause_if_due(since_pause + len(batch), yield_every)
+    if pending:
+        yield pending
+
+
+async def buffered(
+    source: typing.AsyncIterable[T], maxsize: int = DEFAULT_QUEUE_SIZE
+) -> typing.AsyncGenerator[T, None]:
+    # Run a pipeline stage in its own task, passing items through a bounded queue.
+    # The stage pauses whenever maxsize items are waiting, so a slow consumer holds back its producer.
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as exc:
+            await queue.put(_Failure(exc))
+        else:
+            await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        producer.cancel()
+
+
+class _Failure(typing.NamedTuple):
+    # Carries a producer's exception through the queue, so it is raised in the consumer.
+    error: Exception
+
+
+async def _pause_if_due(count: int, yield_every: int) -> int:
+    if count < yield_every:
+        return count
+    await asyncio.sleep(0)
+    return 0
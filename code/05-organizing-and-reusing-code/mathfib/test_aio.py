@@ -0,0 +1,113 @@
+"""Unit tests for the mathfib.aio module."""
+
+import asyncio
+import itertools
+
+import pytest
+from mathfib import fibonacci, multiples_of
+from mathfib.aio import afibonacci, amultiples_of, buffered
+
+
+async def take(batches, count: int) -> list[list[int]]:
+    result = []
+    async for batch in batches:
+        result.append(batch)
+        if len(result) == count:
+            break
+    return result
+
+
+async def from_list(items):
+    for item in items:
+        yield item
+
+
+class TestAfibonacci:
+    """Tests for the batched async fibonacci generator."""
+
+    def test_batches_continue_the_sequence(self):
+        """Test that consecutive batches are the fibonacci sequence cut into batch_size pieces."""
+        batches = asyncio.run(take(afibonacci(batch_size=7), 3))
+        assert [len(b) for b in batches] == [7, 7, 7]
+        assert list(itertools.chain(*batches)) == list(itertools.islice(fibonacci(), 21))
+
+    def test_yields_to_other_tasks(self):
+        """Test that a long run lets other tasks on the event loop make progress."""
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await take(afibonacci(batch_size=10, yield_every=10), 20)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) > 1
+
+
+class TestAmultiplesOf:
+    """Tests for the batched async multiples_of filter."""
+
+    def test_regroups_multiples_into_batches(self):
+        """Test that multiples are regrouped into full batches, with any remainder sent at the end."""
+        numbers = list(range(1, 100))
+        batches = asyncio.run(take(amultiples_of(from_list([numbers[:40], numbers[40:]]), 3, batch_size=10), 10))
+        assert [len(b) for b in batches] == [10, 10, 10, 3]
+        assert list(itertools.chain(*batches)) == list(multiples_of(numbers, 3))
+
+    def test_fibonacci_pipeline(self):
+        """Test that afibonacci feeds amultiples_of like the synchronous generators."""
+        batches = asyncio.run(take(amultiples_of(afibonacci(batch_size=50), 5, batch_size=4), 2))
+        expected = list(itertools.islice(multiples_of(fibonacci(), 5), 8))
+        assert list(itertools.chain(*batches)) == expected
+
+
+class TestBuffered:
+    """Tests for the bounded-queue pipeline stage."""
+
+    def test_passes_items_through_in_order(self):
+        """Test that buffered yields exactly what its source does."""
+
+        async def run():
+            return [item async for item in buffered(from_list(range(50)), maxsize=2)]
+
+        assert asyncio.run(run()) == list(range(50))
+
+    def test_producer_waits_for_slow_consumer(self):
+        """Test that the producer runs at most maxsize items ahead of the consumer."""
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for item in range(100):
+                produced += 1
+                yield item
+
+        async def run():
+            ahead = []
+            async for item in buffered(source(), maxsize=3):
+                await asyncio.sleep(0)
+                ahead.append(produced - item - 1)
+            return max(ahead)
+
+        # maxsize items in the queue, plus one the producer is holding while it waits for space.
+        assert asyncio.run(run()) <= 3 + 1
+
+    def test_source_error_is_raised_in_consumer(self):
+        """Test that an exception in the source reaches the consumer."""
+
+        async def failing():
+            yield 1
+            raise KeyError('boom')
+
+        async def run():
+            return [item async for item in buffered(failing())]
+
+        with pytest.raises(KeyError):
+            asyncio.run(run())
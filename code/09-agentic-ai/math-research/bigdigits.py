@@ -0,0 +1,210 @@
+"""Decimal conversion and digit statistics for very large ints, such as million-digit Fibonacci numbers."""
+
+import decimal
+import functools
+import typing
+
+SMALL_BITS = 1024  # ints this small convert directly (well under the 4300-digit int-to-str limit)
+WRITE_CHUNK_DIGITS = 1 << 20
+GUARD_DIGITS = 30  # extra precision when working out digit counts and leading digits from logarithms
+BOUNDARY_TOLERANCE = decimal.Decimal('1e-20')  # closer than this to a whole number, check against n exactly
+
+
+def to_decimal(n: int) -> str:
+    """Convert an int of any size to its decimal string, in subquadratic time.
+
+    str(n) is quadratic in CPython and refuses ints over 4300 digits by default. Instead, n is
+    split in half by bits, each half converted recursively to a decimal.Decimal, and the halves
+    recombined as hi * 2**k + lo. libmpdec's multiplication is subquadratic, and a Decimal
+    already stores decimal digits, so the final str() is linear.
+
+    Args:
+        n: The int to convert
+
+    Returns:
+        str: The decimal digits of n, with a leading '-' if it is negative
+
+    Example:
+        >>> to_decimal(2**100)
+        '1267650600228229401496703205376'
+    """
+    if n < 0:
+        return '-' + to_decimal(-n)
+    with decimal.localcontext(_exact_context()):
+        return str(_to_decimal(n, n.bit_length()))
+
+
+def digit_count(n: int) -> int:
+    """Count the decimal digits of n exactly, without converting it to a string.
+
+    The count comes from log10(n), worked out from n's top bits. Only when n is so close to a
+    power of ten that the logarithm cannot tell which side it is on is n compared exactly.
+
+    Args:
+        n: The int to measure (its sign is ignored)
+
+    Returns:
+        int: The number of decimal digits in n (1 for zero)
+
+    Example:
+        >>> digit_count(2**100)
+        31
+    """
+    n = abs(n)
+    if n.bit_length() <= SMALL_BITS:
+        return len(str(n))
+    whole, fraction = _log10(n, GUARD_DIGITS)
+    if _near_integer(fraction):
+        return _exact_digit_count(n, whole + 1)
+    return whole + 1
+
+
+def leading_digits(n: int, count: int) -> str:
+    """Return the first `count` decimal digits of n, without converting all of it.
+
+    The digits are 10 ** (fractional part of log10(n)), scaled up to `count` digits, with
+    log10(n) computed from n's top bits. Only when that lands too close to a whole number to
+    trust (as for ...999 or ...000) are they confirmed against n with a power of ten.
+
+    Args:
+        n: The int to inspect (its sign is ignored)
+        count: How many leading digits to return (must be positive)
+
+    Returns:
+        str: The leading digits (all of them, if n has fewer than count)
+
+    Raises:
+        ValueError: If count is not positive
+
+    Example:
+        >>> leading_digits(2**100, 5)
+        '12676'
+    """
+    if count <= 0:
+        raise ValueError('count must be positive')
+    n = abs(n)
+    if n.bit_length() <= SMALL_BITS:
+        return str(n)[:count]
+
+    whole, fraction = _log10(n, count + GUARD_DIGITS)
+    digits = _exact_digit_count(n, whole + 1) if _near_integer(fraction) else whole + 1
+    if digits <= count:
+        return to_decimal(n)
+
+    if not _near_integer(fraction):
+        with decimal.localcontext() as ctx:
+            ctx.prec = count + GUARD_DIGITS
+            mantissa = decimal.Decimal(10) ** (fraction + count - 1)
+            estimate = int(mantissa)
+            if not _near_integer(mantissa - estimate):
+                return str(estimate)
+
+    # Right at a boundary like ...999 / ...000 the estimate cannot be trusted, so divide exactly
+    # (cheap despite n's size, as the quotient has only count digits).
+    return str(n // _power_of_ten(digits - count))
+
+
+def digit_frequencies(n: int) -> list[int]:
+    """Count how often each decimal digit 0-9 appears in n.
+
+    Args:
+        n: The int to inspect (its sign is ignored)
+
+    Returns:
+        list[int]: Ten counts, for digits 0 through 9
+
+    Example:
+        >>> digit_frequencies(1_000_112)
+        [3, 3, 1, 0, 0, 0, 0, 0, 0, 0]
+    """
+    text = to_decimal(abs(n))
+    return [text.count(str(d)) for d in range(10)]
+
+
+def write_digits(n: int, file: typing.TextIO, chunk_digits: int = WRITE_CHUNK_DIGITS) -> int:
+    """Write the decimal digits of n to an open text file in chunks, returning how many were written.
+
+    n is converted to a decimal.Decimal as in to_decimal, then split recursively into high and
+    low halves of digits, writing each piece of at most chunk_digits as soon as it is reached,
+    so the full decimal string is never built.
+
+    Args:
+        n: The int to write
+        file: An open, writable text file
+        chunk_digits: The most digits to convert and write per call to file.write
+
+    Returns:
+        int: The number of characters written
+    """
+    if chunk_digits <= 0:
+        raise ValueError('chunk_digits must be positive')
+    if n < 0:
+        file.write('-')
+        return 1 + write_digits(-n, file, chunk_digits)
+    with decimal.localcontext(_exact_context()):
+        return _write_decimal(_to_decimal(n, n.bit_length()), file, chunk_digits, 0)
+
+
+def _to_decimal(n: int, bits: int) -> decimal.Decimal:
+    if bits <= SMALL_BITS:
+        return decimal.Decimal(n)
+    low_bits = bits >> 1
+    high = _to_decimal(n >> low_bits, bits - low_bits)
+    low = _to_decimal(n & ((1 << low_bits) - 1), low_bits)
+    return high * _power_of_two(low_bits) + low
+
+
+def _write_decimal(d: decimal.Decimal, file: typing.TextIO, chunk_digits: int, width: int) -> int:
+    # Write d's digits, padded with leading zeros to width (a low half keeps its zeros), high half first.
+    digits = d.adjusted() + 1 if d else 1
+    if max(digits, width) <= chunk_digits:
+        text = str(d).zfill(width)
+        file.write(text)
+        return len(text)
+    low_digits = max(digits, width) // 2
+    high, low = divmod(d, decimal.Decimal(1).scaleb(low_digits))
+    written = _write_decimal(high, file, chunk_digits, max(width - low_digits, 0))
+    return written + _write_decimal(low, file, chunk_digits, low_digits)
+
+
+def _log10(n: int, digits_after_point: int) -> tuple[int, decimal.Decimal]:
+    # log10(n) split into its whole part and its fraction, from just enough of n's top bits that
+    # dropping the rest (a relative change under 2**-(4 * digits_after_point)) stays below the precision.
+    shift = max(n.bit_length() - 4 * digits_after_point - 64, 0)
+    with decimal.localcontext() as ctx:
+        ctx.prec = digits_after_point + len(str(n.bit_length()))
+        log10 = decimal.Decimal(n >> shift).log10() + shift * decimal.Decimal(2).log10()
+        whole = int(log10)
+        return whole, log10 - whole
+
+
+def _near_integer(x: decimal.Decimal) -> bool:
+    # Too close to a whole number for a GUARD_DIGITS-accurate estimate to say which side it is on.
+    fraction = x % 1
+    return min(fraction, 1 - fraction) < BOUNDARY_TOLERANCE
+
+
+def _exact_digit_count(n: int, estimate: int) -> int:
+    while n < _power_of_ten(estimate - 1):
+        estimate -= 1
+    while n >= _power_of_ten(estimate):
+        estimate += 1
+    return estimate
+
+
+@functools.lru_cache(maxsize=128)
+def _power_of_two(exponent: int) -> decimal.Decimal:
+    # The recursion only ever asks for a few distinct exponents per conversion.
+    with decimal.localcontext(_exact_context()):
+        return decimal.Decimal(2) ** exponent
+
+
+@functools.lru_cache(maxsize=16)
+def _power_of_ten(exponent: int) -> int:
+    return 10**exponent
+
+
+def _exact_context() -> decimal.Context:
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    context.traps[decimal.Inexact] = True
+    return context
@@ -1,4 +1,18 @@
-from collections.abc import Generator, Iterable
+import collections
+import concurrent.futures
+import functools
+import itertools
+import math
+import os
+from collections.abc import Callable, Generator, Iterable
+
+import bigdigits
+
+PISANO_CACHE_SIZE = 1024
+WORD_MODULUS_LIMIT = 2**32  # below this, one product of residues fits in a uint64 word (a sum of two may not)
+TRIAL_DIVISION_LIMIT = 10_000
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+PARALLEL_CHUNK_SIZE = 10_000
 
 
 def fibonacci() -> Generator[int, None, None]:
@@ -41,3 +55,523 @@ def multiples_of(collection: Iterable[int], number: int) -> Generator[int, None,
     for n in collection:
         if n % number == 0:
             yield n
+
+
+def nth(n: int) -> int:
+    """Compute the nth Fibonacci number directly, in O(log n) big-int operations.
+
+    Uses fast doubling, so F(10_000_000) never materializes the ten million terms before it.
+    Indexing follows F(0) = 0, F(1) = 1, so fibonacci() yields nth(1), nth(2), nth(3), ...
+
+    Args:
+        n: Index of the term to compute (must be non-negative)
+
+    Returns:
+        int: The Fibonacci number F(n)
+
+    Raises:
+        ValueError: If n is negative
+
+    Example:
+        >>> nth(10)
+        55
+    """
+    return _fib_pair(n)[0]
+
+
+def fib_range(start: int, stop: int) -> Generator[int, None, None]:
+    """Generate the Fibonacci numbers F(start) through F(stop - 1).
+
+    The first two terms are seeded by fast doubling, then the rest follow by addition,
+    so a range deep into the sequence costs nothing for the terms before it.
+
+    Args:
+        start: Index of the first term (must be non-negative)
+        stop: Index one past the last term
+
+    Yields:
+        int: F(start), F(start + 1), ..., F(stop - 1)
+
+    Raises:
+        ValueError: If start is negative
+
+    Example:
+        >>> list(fib_range(10, 15))
+        [55, 89, 144, 233, 377]
+    """
+    current, nxt = _fib_pair(start)
+    for _ in range(start, stop):
+        yield current
+        current, nxt = nxt, nxt + current
+
+
+def fibonacci_parallel(
+    start: int,
+    stop: int,
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    reducer: Callable[[int], int] | None = None,
+) -> Generator[int, None, None]:
+    """Generate F(start) through F(stop - 1) across a pool of worker processes.
+
+    The range is split into chunks; each worker seeds its chunk's first pair by fast doubling
+    and adds forward from there, so no chunk waits on the one before it. Results stream back in
+    order, with only a few chunks in flight at a time. Pass a reducer (a picklable function,
+    such as digit_sum or functools.partial(residue, modulus=m)) to have workers send back a
+    small value per term instead of the whole big int.
+
+    Args:
+        start: Index of the first term (must be non-negative)
+        stop: Index one past the last term
+        workers: Number of worker processes (defaults to the number of CPUs)
+        chunk_size: How many terms each worker task computes
+        reducer: Applied to every term inside the workers, if given
+
+    Yields:
+        int: F(start), ..., F(stop - 1), or reducer applied to each
+
+    Raises:
+        ValueError: If start is negative or chunk_size is not positive
+
+    Example:
+        >>> list(fibonacci_parallel(10, 15, workers=2, chunk_size=2))
+        [55, 89, 144, 233, 377]
+    """
+    if start < 0:
+        raise ValueError('Index must be non-negative')
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    chunks = ((i, min(i + chunk_size, stop)) for i in range(start, stop, chunk_size))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: collections.deque[concurrent.futures.Future] = collections.deque()
+        for chunk_start, chunk_stop in chunks:
+            in_flight.append(pool.submit(_fib_chunk, chunk_start, chunk_stop, reducer))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def digit_sum(n: int) -> int:
+    """Sum the decimal digits of n, e.g. as a reducer for fibonacci_parallel.
+
+    Small ints go through str(); larger ones through bigdigits, since str() refuses ints over
+    4300 digits (every F(n) past about n = 20,600) and is quadratic below that anyway.
+    """
+    n = abs(n)
+    if n.bit_length() <= bigdigits.SMALL_BITS:
+        return sum(map(int, str(n)))
+    return sum(digit * count for digit, count in enumerate(bigdigits.digit_frequencies(n)))
+
+
+def residue(n: int, modulus: int) -> int:
+    """Return n mod modulus, e.g. as a reducer for fibonacci_parallel via functools.partial."""
+    return n % modulus
+
+
+def tribonacci_nth(n: int) -> int:
+    """Compute the nth tribonacci number directly, in O(log n) 3x3 matrix multiplications.
+
+    Indexing follows T(0) = 0, T(1) = 1, T(2) = 1, matching fibonacci3s.three_fib:
+    three_fib(k)[n] == tribonacci_nth(n) for every n < k.
+
+    Args:
+        n: Index of the term to compute (must be non-negative)
+
+    Returns:
+        int: The tribonacci number T(n)
+
+    Raises:
+        ValueError: If n is negative
+
+    Example:
+        >>> [tribonacci_nth(n) for n in range(8)]
+        [0, 1, 1, 2, 4, 7, 13, 24]
+    """
+    if n < 0:
+        raise ValueError('Index must be non-negative')
+
+    # [[1, 1, 1], [1, 0, 0], [0, 1, 0]]^n maps (T(2), T(1), T(0)) to (T(n+2), T(n+1), T(n)).
+    result = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    step = ((1, 1, 1), (1, 0, 0), (0, 1, 0))
+    while n:
+        if n & 1:
+            result = _matrix_multiply(result, step)
+        step = _matrix_multiply(step, step)
+        n >>= 1
+
+    # T(n) is the last row applied to (T(2), T(1), T(0)) = (1, 1, 0).
+    return result[2][0] + result[2][1]
+
+
+def kbonacci(k: int, seed: Iterable[int] | None = None) -> Generator[int, None, None]:
+    """Generate the k-bonacci sequence, where each term is the sum of the k before it.
+
+    Only the last k terms are kept (in a ring buffer, with a running sum), so memory stays
+    bounded no matter how many terms are generated. By default the sequence starts 0, 1,
+    matching fibonacci3s: k=2 gives 0, 1, 1, 2, 3, ... and k=3 gives three_fib's 0, 1, 1, 2, 4, ...
+
+    Args:
+        k: How many previous terms each term sums (must be at least 2)
+        seed: The first k terms; defaults to k - 1 zeros and a one, with the leading zeros skipped
+
+    Yields:
+        int: The next term of the sequence
+
+    Raises:
+        ValueError: If k is less than 2 or seed does not have k terms
+
+    Example:
+        >>> tri = kbonacci(3)
+        >>> [next(tri) for _ in range(8)]
+        [0, 1, 1, 2, 4, 7, 13, 24]
+    """
+    if k < 2:
+        raise ValueError('k must be at least 2')
+
+    if seed is None:
+        window = collections.deque([0] * (k - 1) + [1], maxlen=k)
+        yield from (0, 1)
+    else:
+        window = collections.deque(seed, maxlen=k)
+        if len(window) != k:
+            raise ValueError('seed must have exactly k terms')
+        yield from window
+
+    total = sum(window)
+    while True:
+        term = total
+        # The oldest term drops out of the window as the new one goes in.
+        total += term - window[0]
+        window.append(term)
+        yield term
+
+
+def kbonacci_terms(k: int, count: int, keep_every: int = 1, keep_last: int | None = None) -> list[int]:
+    """Collect terms 0 through count - 1 of kbonacci(k), keeping only some of them.
+
+    Args:
+        k: How many previous terms each term sums (must be at least 2)
+        count: How many terms to generate
+        keep_every: Keep only terms whose index is a multiple of this
+        keep_last: If given, keep only the last this many of the kept terms
+
+    Returns:
+        list[int]: The kept terms, in order
+
+    Raises:
+        ValueError: If keep_every is not positive
+
+    Example:
+        >>> kbonacci_terms(2, 10, keep_every=3)
+        [0, 2, 8, 34]
+    """
+    if keep_every <= 0:
+        raise ValueError('keep_every must be positive')
+
+    kept = collections.deque(maxlen=keep_last)
+    for index, term in zip(range(count), kbonacci(k)):
+        if index % keep_every == 0:
+            kept.append(term)
+    return list(kept)
+
+
+def fibonacci_multiples_of(number: int) -> Generator[int, None, None]:
+    """Generate the Fibonacci numbers that are multiples of a given number.
+
+    Yields exactly what multiples_of(fibonacci(), number) does, without testing every term.
+    F(n) is divisible by number exactly when n is a multiple of the rank of apparition
+    (see rank_of_apparition), so the generator jumps straight from one such n to the next.
+
+    Args:
+        number: The number to find multiples of (must be positive)
+
+    Yields:
+        int: Fibonacci numbers that are multiples of the given number
+
+    Raises:
+        ValueError: If number is not positive
+
+    Example:
+        >>> multiples = fibonacci_multiples_of(4)
+        >>> [next(multiples) for _ in range(3)]
+        [8, 144, 2584]
+    """
+    if number <= 0:
+        raise ValueError('Number must be positive')
+
+    rank = rank_of_apparition(number)
+    step, step_next = _fib_pair(rank)
+    current, nxt = step, step_next
+    while True:
+        yield current
+        # F(n + r) = F(n) * F(r + 1) + F(n - 1) * F(r), and F(n + r + 1) = F(n + 1) * F(r + 1) + F(n) * F(r)
+        current, nxt = current * step_next + (nxt - current) * step, nxt * step_next + current * step
+
+
+def rank_of_apparition(number: int) -> int:
+    """Find the smallest n > 0 such that F(n) is a multiple of the given number.
+
+    Works from the prime factorization: for a prime p other than 2 and 5, the rank divides
+    p - 1 or p + 1 (depending on p mod 5); for a prime power it is a multiple of the prime's
+    rank by a power of p; and for a product it is the lcm of the prime-power ranks.
+
+    Args:
+        number: The number to find the rank of (must be positive)
+
+    Returns:
+        int: The rank of apparition of number
+
+    Raises:
+        ValueError: If number is not positive
+
+    Example:
+        >>> rank_of_apparition(10)
+        15
+    """
+    if number <= 0:
+        raise ValueError('Number must be positive')
+
+    rank = 1
+    for prime, power in _factorize(number).items():
+        rank = math.lcm(rank, _prime_power_rank(prime, power))
+    return rank
+
+
+def fib_mod(n: int, modulus: int) -> int:
+    """Compute F(n) mod m without ever building F(n).
+
+    n is first reduced modulo the Pisano period of m, then fast doubling runs on residues,
+    so every intermediate stays below m squared.
+
+    Args:
+        n: Index of the term (must be non-negative)
+        modulus: The modulus m (must be positive)
+
+    Returns:
+        int: F(n) mod m
+
+    Raises:
+        ValueError: If n is negative or modulus is not positive
+
+    Example:
+        >>> fib_mod(10**18, 1_000_000_007)
+        209783453
+    """
+    if n < 0:
+        raise ValueError('Index must be non-negative')
+    return _fib_pair_mod(n % pisano_period(modulus), modulus)[0]
+
+
+def fib_mod_many(indexes: Iterable[int], modulus: int):
+    """Compute F(n) mod m for a whole array of indexes at once with NumPy.
+
+    Every index runs through the same fast-doubling steps together. For moduli below 2**32
+    the work is done in uint64 words; larger moduli fall back to Python ints in an object array.
+
+    Args:
+        indexes: Non-negative indexes (a list or NumPy array)
+        modulus: The modulus m (must be positive)
+
+    Returns:
+        numpy.ndarray: F(n) mod m for each index, in the same shape as indexes
+
+    Raises:
+        ValueError: If any index is negative or modulus is not positive
+
+    Example:
+        >>> fib_mod_many([5, 10, 15], 7).tolist()
+        [5, 6, 1]
+    """
+    import numpy as np
+
+    period = pisano_period(modulus)
+    dtype = np.uint64 if modulus < WORD_MODULUS_LIMIT else object
+    n = np.asarray(indexes, dtype=object)
+    if (n < 0).any():
+        raise ValueError('Index must be non-negative')
+    # Work on a flat array: arithmetic on 0-d object arrays gives plain ints, which np.where would turn into int64.
+    shape = n.shape
+    n = (n.reshape(-1) % period).astype(dtype)
+
+    a = np.zeros(n.shape, dtype=dtype)
+    b = np.full(n.shape, 1 % modulus, dtype=dtype)
+    m = dtype(modulus) if dtype is np.uint64 else modulus
+    for bit in reversed(range(max(int(period - 1).bit_length(), 1))):
+        # Same doubling as _fib_pair_mod, with m added before subtracting so unsigned words never go negative.
+        # Each square is reduced before adding: a * a + b * b itself can pass 2**64 when m is near 2**32.
+        a, b = a * ((2 * b + m - a) % m) % m, (a * a % m + b * b % m) % m
+        advance = (n >> bit) & 1 == 1
+        a, b = np.where(advance, b, a), np.where(advance, (a + b) % m, b)
+    return a.reshape(shape)
+
+
+@functools.lru_cache(maxsize=PISANO_CACHE_SIZE)
+def pisano_period(modulus: int) -> int:
+    """Find the Pisano period of m: the period of the Fibonacci sequence mod m.
+
+    Works from the prime factorization, like rank_of_apparition: for a prime p other than
+    2 and 5, the period divides p - 1 or 2(p + 1) (depending on p mod 5); for a prime power
+    it is the prime's period times a power of p; and for a product it is the lcm.
+    The most recently used periods are cached.
+
+    Args:
+        modulus: The modulus m (must be positive)
+
+    Returns:
+        int: The Pisano period of m
+
+    Raises:
+        ValueError: If modulus is not positive
+
+    Example:
+        >>> pisano_period(10)
+        60
+    """
+    if modulus <= 0:
+        raise ValueError('Number must be positive')
+
+    period = 1
+    for prime, power in _factorize(modulus).items():
+        period = math.lcm(period, _prime_power_period(prime, power))
+    return period
+
+
+def _prime_power_period(prime: int, power: int) -> int:
+    if prime == 2:
+        prime_period = 3
+    elif prime == 5:
+        prime_period = 20
+    else:
+        # The period of p divides p - 1 if p is +-1 mod 5, and 2(p + 1) otherwise.
+        bound = prime - 1 if prime % 5 in (1, 4) else 2 * (prime + 1)
+        prime_period = min(d for d in _divisors(bound) if _fib_pair_mod(d, prime) == (0, 1))
+
+    modulus = prime**power
+    period = prime_period
+    while _fib_pair_mod(period, modulus) != (0, 1 % modulus):
+        period *= prime
+    return period
+
+
+def _prime_power_rank(prime: int, power: int) -> int:
+    if prime == 2:
+        prime_rank = 3
+    elif prime == 5:
+        prime_rank = 5
+    else:
+        # The rank of p divides p - 1 if p is +-1 mod 5, and p + 1 otherwise.
+        bound = prime - 1 if prime % 5 in (1, 4) else prime + 1
+        prime_rank = min(d for d in _divisors(bound) if _fib_pair_mod(d, prime)[0] == 0)
+
+    # The rank of p^e is the rank of p times some p^j with j < e; usually j = e - 1.
+    modulus = prime**power
+    rank = prime_rank
+    while _fib_pair_mod(rank, modulus)[0] != 0:
+        rank *= prime
+    return rank
+
+
+def _factorize(number: int) -> dict[int, int]:
+    # Trial division for small factors, then Pollard's rho for whatever is left.
+    factors: dict[int, int] = {}
+    for candidate in itertools.chain([2], range(3, TRIAL_DIVISION_LIMIT, 2)):
+        if candidate * candidate > number:
+            break
+        while number % candidate == 0:
+            factors[candidate] = factors.get(candidate, 0) + 1
+            number //= candidate
+
+    remaining = [number] if number > 1 else []
+    while remaining:
+        n = remaining.pop()
+        if _is_probable_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            divisor = _pollard_rho(n)
+            remaining.extend((divisor, n // divisor))
+    return factors
+
+
+def _is_probable_prime(n: int) -> bool:
+    # Miller-Rabin with the first 13 primes as bases, which is exact for every n below 3.3 * 10**24.
+    # (The first 12 are only exact below 318665857834031151167461, a strong pseudoprime to all of them.)
+    if n < 2:
+        return False
+    for prime in MILLER_RABIN_BASES:
+        if n % prime == 0:
+            return n == prime
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_rho(n: int) -> int:
+    # A non-trivial divisor of the composite n (with no factors below TRIAL_DIVISION_LIMIT).
+    for c in itertools.count(1):
+        x = y = 2
+        divisor = 1
+        while divisor == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            divisor = math.gcd(abs(x - y), n)
+        if divisor != n:
+            return divisor
+
+
+def _divisors(number: int) -> list[int]:
+    divisors = [1]
+    for prime, power in _factorize(number).items():
+        divisors = [d * prime**e for d in divisors for e in range(power + 1)]
+    return sorted(divisors)
+
+
+def _fib_chunk(start: int, stop: int, reducer: Callable[[int], int] | None) -> list[int]:
+    # One fibonacci_parallel task, run in a worker process.
+    terms = fib_range(start, stop)
+    return list(terms if reducer is None else map(reducer, terms))
+
+
+def _fib_pair_mod(n: int, modulus: int) -> tuple[int, int]:
+    # (F(n) mod m, F(n + 1) mod m) by the same fast doubling as _fib_pair, reducing as it goes.
+    a, b = 0, 1 % modulus
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a) % modulus, (a * a + b * b) % modulus
+        if bit == '1':
+            a, b = b, (a + b) % modulus
+    return a, b
+
+
+def _fib_pair(n: int) -> tuple[int, int]:
+    # (F(n), F(n + 1)) by fast doubling:
+    #   F(2k) = F(k) * (2 * F(k + 1) - F(k))
+    #   F(2k + 1) = F(k)^2 + F(k + 1)^2
+    if n < 0:
+        raise ValueError('Index must be non-negative')
+
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == '1':
+            a, b = b, a + b
+    return a, b
+
+
+def _matrix_multiply(x: tuple[tuple[int, ...], ...], y: tuple[tuple[int, ...], ...]) -> tuple[tuple[int, ...], ...]:
+    return tuple(tuple(sum(x[i][k] * y[k][j] for k in range(3)) for j in range(3)) for i in range(3))
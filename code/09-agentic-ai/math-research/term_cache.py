@@ -0,0 +1,152 @@
+"""Opt-in persistent cache of Fibonacci checkpoints, so restarted notebooks resume instead of recomputing."""
+
+import bisect
+import os
+import struct
+from collections.abc import Generator
+
+DEFAULT_EVERY = 100_000
+DEFAULT_MAX_BYTES = 256 * 1024**2
+INDEX_MAGIC = b'FIBIDX1\0'
+INDEX_ENTRY = struct.Struct('<QQQQ')  # term index, data offset, byte length of F(n), byte length of F(n + 1)
+
+
+class TermCache:
+    """Checkpoints of (F(n), F(n + 1)) pairs stored on disk every `every` terms.
+
+    The pairs are appended to `<path>.bin` as raw little-endian bytes, and `<path>.idx` holds a
+    fixed-size entry per checkpoint saying where each pair lives, so loading one checkpoint reads
+    only that pair. When `<path>.bin` grows past max_bytes, every other checkpoint is dropped:
+    the cache stays bounded and still covers the whole range, just more sparsely.
+
+    Example:
+        >>> cache = TermCache('fib_cache', every=10)
+        >>> fib = fibonacci_cached(cache, start=20)
+        >>> [next(fib) for _ in range(3)]
+        [6765, 10946, 17711]
+        >>> cache.indexes
+        [0, 10, 20]
+    """
+
+    def __init__(self, path: str, every: int = DEFAULT_EVERY, max_bytes: int = DEFAULT_MAX_BYTES):
+        if every <= 0:
+            raise ValueError('every must be positive')
+        self.path = path
+        self.every = every
+        self.max_bytes = max_bytes
+        self.data_path = path + '.bin'
+        self.index_path = path + '.idx'
+        self._entries: dict[int, tuple[int, int, int]] = {}
+        self._indexes: list[int] = []
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    @property
+    def indexes(self) -> list[int]:
+        return list(self._indexes)
+
+    def nearest(self, n: int) -> tuple[int, int, int]:
+        """Return (index, F(index), F(index + 1)) for the latest checkpoint at or before n, or (0, 0, 1)."""
+        position = bisect.bisect_right(self._indexes, n)
+        if position == 0:
+            return 0, 0, 1
+        index = self._indexes[position - 1]
+        return (index, *self._read(index))
+
+    def save(self, n: int, current: int, nxt: int) -> None:
+        """Store the pair (F(n), F(n + 1)), unless it is already cached."""
+        if n in self._entries:
+            return
+        self._append(n, current, nxt)
+        while len(self._indexes) > 1 and os.path.getsize(self.data_path) > self.max_bytes:
+            self._thin()
+
+    def clear(self) -> None:
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._entries.clear()
+        self._indexes.clear()
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(INDEX_MAGIC):
+            raise ValueError(f'{self.index_path} is not a term cache index')
+        body = data[len(INDEX_MAGIC) :]
+        usable = len(body) - len(body) % INDEX_ENTRY.size
+        if usable < len(body):
+            # Drop a torn final entry from the file too, or the next append would land misaligned after it.
+            with open(self.index_path, 'r+b') as f:
+                f.truncate(len(INDEX_MAGIC) + usable)
+        for n, offset, current_length, nxt_length in INDEX_ENTRY.iter_unpack(body[:usable]):
+            self._entries[n] = (offset, current_length, nxt_length)
+        self._indexes = sorted(self._entries)
+
+    def _read(self, n: int) -> tuple[int, int]:
+        offset, current_length, nxt_length = self._entries[n]
+        with open(self.data_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(current_length + nxt_length)
+        return int.from_bytes(data[:current_length], 'little'), int.from_bytes(data[current_length:], 'little')
+
+    def _append(self, n: int, current: int, nxt: int) -> None:
+        current_bytes = current.to_bytes((current.bit_length() + 7) // 8, 'little')
+        nxt_bytes = nxt.to_bytes((nxt.bit_length() + 7) // 8, 'little')
+
+        # The data goes in before its index entry, so a crash in between only leaves unreferenced bytes.
+        with open(self.data_path, 'ab') as f:
+            offset = f.tell()
+            f.write(current_bytes + nxt_bytes)
+        with open(self.index_path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(INDEX_MAGIC)
+            f.write(INDEX_ENTRY.pack(n, offset, len(current_bytes), len(nxt_bytes)))
+
+        self._entries[n] = (offset, len(current_bytes), len(nxt_bytes))
+        bisect.insort(self._indexes, n)
+
+    def _thin(self) -> None:
+        # Keep every other checkpoint, always including the furthest one (it saves the most work when resuming),
+        # and rewrite both files compactly. Of just two checkpoints, only the furthest is kept, so this always shrinks.
+        kept = self._indexes[::2]
+        if kept[-1] != self._indexes[-1]:
+            kept.append(self._indexes[-1])
+        if len(kept) == len(self._indexes):
+            kept = kept[-1:]
+        pairs = [(n, *self._read(n)) for n in kept]
+        self.clear()
+        for n, current, nxt in pairs:
+            self._append(n, current, nxt)
+
+
+def fibonacci_cached(cache: TermCache, start: int = 1) -> Generator[int, None, None]:
+    """Generate F(start), F(start + 1), ... like mathf.fibonacci, resuming from the nearest checkpoint.
+
+    Every `cache.every` terms along the way a checkpoint is saved, so the next run starts closer.
+    With the default start=1 it yields exactly what mathf.fibonacci() does.
+
+    Args:
+        cache: The TermCache to load checkpoints from and save them to
+        start: Index of the first term to yield (must be non-negative)
+
+    Yields:
+        int: The Fibonacci numbers from F(start) on
+
+    Raises:
+        ValueError: If start is negative
+    """
+    if start < 0:
+        raise ValueError('Index must be non-negative')
+
+    n, current, nxt = cache.nearest(start)
+    while True:
+        if n % cache.every == 0:
+            cache.save(n, current, nxt)
+        if n >= start:
+            yield current
+        n, current, nxt = n + 1, nxt, current + nxt
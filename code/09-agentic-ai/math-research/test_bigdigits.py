@@ -0,0 +1,84 @@
+"""Unit tests for the bigdigits module."""
+
+import io
+import sys
+
+import pytest
+from bigdigits import digit_count, digit_frequencies, leading_digits, to_decimal, write_digits
+from mathf import nth
+
+# Large enough to pass the default 4300-digit int-to-str limit, which the checks below lift.
+BIG_TERMS = [nth(30_000), 3**20_000, 10**5_000, 10**5_000 - 1]
+# Leading digits that sit right on a ...000 / ...999 boundary, where logarithms alone cannot decide.
+BOUNDARY_TERMS = [123 * 10**4_000, (10**20 - 1) * 10**4_000 + 1, (10**20 - 1) * 10**4_000 - 1, 10**5_000 + 1]
+SMALL_NUMBERS = [0, 1, 9, 10, 99, 100, 12345, 2**64, 10**50 - 1, 10**50]
+
+
+@pytest.fixture
+def unlimited_str_digits():
+    previous = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    yield
+    sys.set_int_max_str_digits(previous)
+
+
+class TestToDecimal:
+    """Tests for to_decimal."""
+
+    def test_to_decimal_small_numbers(self):
+        """Test that small numbers convert like str."""
+        for n in SMALL_NUMBERS:
+            assert to_decimal(n) == str(n)
+
+    def test_to_decimal_negative(self):
+        """Test that negative numbers keep their sign."""
+        assert to_decimal(-12345) == '-12345'
+
+    def test_to_decimal_big_numbers(self, unlimited_str_digits):
+        """Test numbers past the int-to-str digit limit."""
+        for n in BIG_TERMS:
+            assert to_decimal(n) == str(n)
+
+    def test_write_digits(self):
+        """Test writing digits to a file in small chunks."""
+        out = io.StringIO()
+        assert write_digits(2**100, out, chunk_digits=7) == 31
+        assert out.getvalue() == str(2**100)
+
+    def test_write_digits_streams_chunks(self, unlimited_str_digits):
+        """Test that big numbers are written piece by piece, keeping the zeros inside low halves."""
+        for n in BIG_TERMS + BOUNDARY_TERMS + [-(10**5_000)]:
+            writes = []
+            out = io.StringIO()
+            out.write = lambda text: writes.append(text) or len(text)
+            assert write_digits(n, out, chunk_digits=1_000) == len(str(n))
+            assert ''.join(writes) == str(n)
+            assert max(map(len, writes)) <= 1_000
+            assert len(writes) > 1
+
+
+class TestDigitStatistics:
+    """Tests for digit_count, leading_digits and digit_frequencies."""
+
+    def test_digit_count(self, unlimited_str_digits):
+        """Test exact digit counts, including at powers of ten."""
+        for n in SMALL_NUMBERS + BIG_TERMS + BOUNDARY_TERMS:
+            assert digit_count(n) == len(str(n))
+
+    def test_leading_digits(self, unlimited_str_digits):
+        """Test leading digits, including ...999 and ...000 boundaries."""
+        for n in SMALL_NUMBERS + BIG_TERMS + BOUNDARY_TERMS:
+            for count in (1, 5, 15, 20, 25):
+                assert leading_digits(n, count) == str(n)[:count]
+
+    def test_leading_digits_bad_count_raises_error(self):
+        """Test that a non-positive count raises ValueError."""
+        with pytest.raises(ValueError, match='count must be positive'):
+            leading_digits(123, 0)
+
+    def test_digit_frequencies(self, unlimited_str_digits):
+        """Test that digit frequencies add up to the digit count."""
+        n = nth(30_000)
+        frequencies = digit_frequencies(n)
+        assert frequencies == [str(n).count(str(d)) for d in range(10)]
+        assert sum(frequencies) == digit_count(n)
@@ -1,7 +1,26 @@
 """Unit tests for the mathf library."""
 
+import functools
+
 import pytest
-from mathf import fibonacci, multiples_of
+from mathf import (
+    _factorize,
+    digit_sum,
+    fib_mod,
+    fib_mod_many,
+    fib_range,
+    fibonacci,
+    fibonacci_multiples_of,
+    fibonacci_parallel,
+    kbonacci,
+    kbonacci_terms,
+    multiples_of,
+    nth,
+    pisano_period,
+    rank_of_apparition,
+    residue,
+    tribonacci_nth,
+)
 
 
 class TestFibonacci:
@@ -91,3 +110,225 @@ class TestMultiplesOf:
         collection = [2, 4, 2, 6, 4]
         result = list(multiples_of(collection, 2))
         assert result == [2, 4, 2, 6, 4]
+
+
+class TestNth:
+    """Tests for the fast-doubling nth function."""
+
+    def test_nth_first_terms(self):
+        """Test the first few terms, including F(0)."""
+        assert [nth(n) for n in range(8)] == [0, 1, 1, 2, 3, 5, 8, 13]
+
+    def test_nth_agrees_with_generator(self):
+        """Test that nth(k) is the kth number yielded by fibonacci."""
+        fib = fibonacci()
+        for k in range(1, 1001):
+            assert nth(k) == next(fib)
+
+    def test_nth_large_index(self):
+        """Test a large index against the defining recurrence."""
+        assert nth(10_000) + nth(10_001) == nth(10_002)
+
+    def test_nth_negative_raises_error(self):
+        """Test that a negative index raises ValueError."""
+        with pytest.raises(ValueError, match='Index must be non-negative'):
+            nth(-1)
+
+
+class TestFibRange:
+    """Tests for the fib_range generator."""
+
+    def test_fib_range_from_start(self):
+        """Test a range starting at F(0)."""
+        assert list(fib_range(0, 6)) == [0, 1, 1, 2, 3, 5]
+
+    def test_fib_range_agrees_with_generator(self):
+        """Test a range deep into the sequence against the generator."""
+        fib = fibonacci()
+        expected = [next(fib) for _ in range(600)][499:]
+        assert list(fib_range(500, 601)) == expected
+
+    def test_fib_range_empty(self):
+        """Test that stop <= start gives no terms."""
+        assert list(fib_range(5, 5)) == []
+
+
+class TestTribonacciNth:
+    """Tests for the matrix-power tribonacci_nth function."""
+
+    def test_tribonacci_nth_agrees_with_linear_sequence(self):
+        """Test against the linear recurrence used by three_fib."""
+        expected = [0, 1, 1]
+        for i in range(3, 300):
+            expected.append(expected[i - 1] + expected[i - 2] + expected[i - 3])
+        assert [tribonacci_nth(n) for n in range(300)] == expected
+
+    def test_tribonacci_nth_negative_raises_error(self):
+        """Test that a negative index raises ValueError."""
+        with pytest.raises(ValueError, match='Index must be non-negative'):
+            tribonacci_nth(-1)
+
+
+class TestKbonacci:
+    """Tests for the kbonacci generator and kbonacci_terms."""
+
+    def test_kbonacci_two_is_fibonacci(self):
+        """Test that k=2 gives the Fibonacci sequence from 0."""
+        fib = kbonacci(2)
+        assert [next(fib) for _ in range(200)] == [nth(n) for n in range(200)]
+
+    def test_kbonacci_three_is_tribonacci(self):
+        """Test that k=3 gives three_fib's tribonacci sequence."""
+        tri = kbonacci(3)
+        assert [next(tri) for _ in range(200)] == [tribonacci_nth(n) for n in range(200)]
+
+    def test_kbonacci_four(self):
+        """Test the tetranacci sequence."""
+        tetra = kbonacci(4)
+        assert [next(tetra) for _ in range(9)] == [0, 1, 1, 2, 4, 8, 15, 29, 56]
+
+    def test_kbonacci_custom_seed(self):
+        """Test that a custom seed is yielded first, then continued."""
+        lucas = kbonacci(2, seed=[2, 1])
+        assert [next(lucas) for _ in range(6)] == [2, 1, 3, 4, 7, 11]
+
+    def test_kbonacci_bad_arguments_raise_error(self):
+        """Test that k < 2 and a wrong-length seed raise ValueError."""
+        with pytest.raises(ValueError, match='k must be at least 2'):
+            next(kbonacci(1))
+        with pytest.raises(ValueError, match='seed must have exactly k terms'):
+            next(kbonacci(3, seed=[0, 1]))
+
+    def test_kbonacci_terms_keep_every(self):
+        """Test keeping every m-th term."""
+        assert kbonacci_terms(2, 10, keep_every=3) == [0, 2, 8, 34]
+
+    def test_kbonacci_terms_keep_last(self):
+        """Test keeping only the last N terms."""
+        assert kbonacci_terms(3, 10, keep_last=3) == [24, 44, 81]
+
+    def test_kbonacci_terms_keep_every_and_last(self):
+        """Test combining both retention policies."""
+        assert kbonacci_terms(2, 20, keep_every=5, keep_last=2) == [nth(10), nth(15)]
+
+
+class TestFibonacciMultiplesOf:
+    """Tests for fibonacci_multiples_of and rank_of_apparition."""
+
+    @pytest.mark.parametrize('number', [1, 2, 3, 4, 5, 8, 10, 12, 25, 49, 97, 100, 144, 1000])
+    def test_fibonacci_multiples_of_matches_filtering(self, number):
+        """Test that results are identical to filtering the fibonacci generator."""
+        fast = fibonacci_multiples_of(number)
+        slow = multiples_of(fibonacci(), number)
+        assert [next(fast) for _ in range(8)] == [next(slow) for _ in range(8)]
+
+    def test_rank_of_apparition_is_first_multiple(self):
+        """Test the rank against a direct search for the first F(n) divisible by number."""
+        for number in range(1, 300):
+            n, current, nxt = 1, 1, 1
+            while current % number != 0:
+                n, current, nxt = n + 1, nxt, current + nxt
+            assert rank_of_apparition(number) == n
+
+    def test_fibonacci_multiples_of_large_number(self):
+        """Test a large modulus, where filtering would be far too slow."""
+        multiples = fibonacci_multiples_of(1_000_003)
+        for _ in range(2):
+            assert next(multiples) % 1_000_003 == 0
+
+    def test_fibonacci_multiples_of_zero_raises_error(self):
+        """Test that zero raises ValueError."""
+        with pytest.raises(ValueError, match='Number must be positive'):
+            next(fibonacci_multiples_of(0))
+
+
+class TestFibMod:
+    """Tests for fib_mod, fib_mod_many and pisano_period."""
+
+    def test_pisano_period_matches_brute_force(self):
+        """Test the period against directly finding when (0, 1) comes back."""
+        for modulus in range(1, 400):
+            period, current, nxt = 1, 1 % modulus, 1 % modulus
+            while (current, nxt) != (0, 1 % modulus):
+                period, current, nxt = period + 1, nxt, (current + nxt) % modulus
+            assert pisano_period(modulus) == period
+
+    def test_pisano_period_large_prime(self):
+        """Test a prime too large for trial division."""
+        modulus = 2**61 - 1
+        period = pisano_period(modulus)
+        assert fib_mod(period, modulus) == 0
+        assert fib_mod(period + 1, modulus) == 1
+
+    @pytest.mark.parametrize('modulus', [1, 2, 10, 97, 1_000_000_007, 2**61 - 1])
+    def test_fib_mod_matches_nth(self, modulus):
+        """Test fib_mod against reducing the full Fibonacci number."""
+        for n in [*range(200), 1_000, 12_345]:
+            assert fib_mod(n, modulus) == nth(n) % modulus
+
+    def test_fib_mod_huge_index(self):
+        """Test an index far too large to compute F(n) itself."""
+        assert fib_mod(10**18, 1_000_000_007) == 209783453
+
+    @pytest.mark.parametrize('modulus', [1, 7, 1_000_000_007, 2**32 - 5, 2**61 - 1])
+    def test_fib_mod_many_matches_fib_mod(self, modulus):
+        """Test the vectorized version, for word-sized and larger moduli."""
+        indexes = [*range(100), 10**18, 10**30]
+        assert fib_mod_many(indexes, modulus).tolist() == [fib_mod(n, modulus) for n in indexes]
+
+    def test_fib_mod_many_scalar_index(self):
+        """Test that a single index gives a 0-d array rather than failing."""
+        assert fib_mod_many(10**18, 1_000_000_007).tolist() == 209783453
+        assert fib_mod_many(12_345, 2**61 - 1).tolist() == fib_mod(12_345, 2**61 - 1)
+
+    def test_strong_pseudoprime_is_factored(self):
+        """Test a composite that Miller-Rabin with only the first 12 primes as bases takes for a prime."""
+        assert _factorize(318665857834031151167461) == {399165290221: 1, 798330580441: 1}
+
+    def test_fib_mod_bad_arguments_raise_error(self):
+        """Test that negative indexes and non-positive moduli raise ValueError."""
+        with pytest.raises(ValueError, match='Index must be non-negative'):
+            fib_mod(-1, 10)
+        with pytest.raises(ValueError, match='Index must be non-negative'):
+            fib_mod_many([1, -1], 10)
+        with pytest.raises(ValueError, match='Number must be positive'):
+            pisano_period(0)
+
+
+class TestFibonacciParallel:
+    """Tests for the fibonacci_parallel generator."""
+
+    def test_fibonacci_parallel_matches_fib_range(self):
+        """Test that chunked parallel results arrive complete and in order."""
+        assert list(fibonacci_parallel(3, 250, workers=2, chunk_size=16)) == list(fib_range(3, 250))
+
+    def test_fibonacci_parallel_digit_sum_reducer(self):
+        """Test reducing terms to digit sums inside the workers."""
+        expected = [digit_sum(f) for f in fib_range(0, 100)]
+        assert list(fibonacci_parallel(0, 100, workers=2, chunk_size=30, reducer=digit_sum)) == expected
+
+    def test_fibonacci_parallel_digit_sum_past_str_limit(self):
+        """Test digit sums of terms with more than 4300 digits, which str() refuses."""
+        expected = [_digit_sum_by_division(f) for f in fib_range(25_000, 25_004)]
+        assert list(fibonacci_parallel(25_000, 25_004, workers=2, chunk_size=2, reducer=digit_sum)) == expected
+
+    def test_fibonacci_parallel_residue_reducer(self):
+        """Test reducing terms mod m inside the workers."""
+        reducer = functools.partial(residue, modulus=97)
+        expected = [fib_mod(n, 97) for n in range(500, 700)]
+        assert list(fibonacci_parallel(500, 700, workers=2, chunk_size=64, reducer=reducer)) == expected
+
+    def test_fibonacci_parallel_empty_range(self):
+        """Test that stop <= start gives no terms."""
+        assert list(fibonacci_parallel(10, 10, workers=1)) == []
+
+
+def _digit_sum_by_division(n: int) -> int:
+    # Independent of str() and bigdigits: peel off 100 digits at a time.
+    total = 0
+    while n:
+        n, block = divmod(n, 10**100)
+        while block:
+            block, digit = divmod(block, 10)
+            total += digit
+    return total
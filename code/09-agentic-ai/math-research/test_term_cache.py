@@ -0,0 +1,97 @@
+"""Unit tests for the term_cache module."""
+
+import os
+
+import pytest
+from mathf import fibonacci, nth
+from term_cache import TermCache, fibonacci_cached
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'fib_cache')
+
+
+class TestFibonacciCached:
+    """Tests for the fibonacci_cached generator."""
+
+    def test_matches_fibonacci(self, cache_path):
+        """Test that the default start yields what fibonacci does."""
+        cached = fibonacci_cached(TermCache(cache_path, every=7))
+        fib = fibonacci()
+        assert [next(cached) for _ in range(100)] == [next(fib) for _ in range(100)]
+
+    def test_saves_checkpoints_every_k_terms(self, cache_path):
+        """Test that checkpoints land on multiples of every."""
+        cache = TermCache(cache_path, every=10)
+        cached = fibonacci_cached(cache)
+        for _ in range(35):
+            next(cached)
+        assert cache.indexes == [0, 10, 20, 30]
+
+    def test_resumes_from_checkpoint_after_restart(self, cache_path):
+        """Test that a new cache object on the same files resumes from disk."""
+        first = fibonacci_cached(TermCache(cache_path, every=100), start=1000)
+        assert next(first) == nth(1000)
+
+        reopened = TermCache(cache_path, every=100)
+        assert reopened.nearest(1050) == (1000, nth(1000), nth(1001))
+        resumed = fibonacci_cached(reopened, start=1050)
+        assert [next(resumed) for _ in range(3)] == [nth(1050), nth(1051), nth(1052)]
+
+    def test_negative_start_raises_error(self, cache_path):
+        """Test that a negative start raises ValueError."""
+        with pytest.raises(ValueError, match='Index must be non-negative'):
+            next(fibonacci_cached(TermCache(cache_path), start=-1))
+
+
+class TestTermCache:
+    """Tests for the TermCache storage."""
+
+    def test_nearest_without_checkpoints(self, cache_path):
+        """Test that an empty cache starts from F(0), F(1)."""
+        assert TermCache(cache_path).nearest(500) == (0, 0, 1)
+
+    def test_size_cap_thins_checkpoints(self, cache_path):
+        """Test that exceeding max_bytes drops every other checkpoint."""
+        cache = TermCache(cache_path, every=100, max_bytes=2000)
+        cached = fibonacci_cached(cache)
+        for _ in range(2000):
+            next(cached)
+        assert os.path.getsize(cache.data_path) <= 2000
+        assert cache.indexes[0] == 0
+        for index in cache.indexes:
+            assert cache.nearest(index) == (index, nth(index), nth(index + 1))
+
+    @pytest.mark.parametrize('count', [4, 5])
+    def test_thinning_keeps_the_furthest_checkpoint(self, cache_path, count):
+        """Test that thinning an even or odd number of checkpoints never drops the largest index."""
+        cache = TermCache(cache_path, every=10)
+        for n in range(0, 10 * count, 10):
+            cache.save(n, nth(n), nth(n + 1))
+        cache._thin()
+        assert cache.indexes[-1] == 10 * (count - 1)
+        assert len(cache.indexes) < count
+
+    def test_size_cap_with_two_checkpoints_keeps_the_furthest(self, cache_path):
+        """Test that when two checkpoints are over the cap, the later one survives and saving still finishes."""
+        cache = TermCache(cache_path, every=10, max_bytes=300)
+        cache.save(1_000, nth(1_000), nth(1_001))
+        cache.save(1_100, nth(1_100), nth(1_101))
+        assert cache.indexes == [1_100]
+
+    def test_torn_index_entry_is_ignored(self, cache_path):
+        """Test that a partially written last index entry does not break loading."""
+        cache = TermCache(cache_path, every=10)
+        cache.save(10, nth(10), nth(11))
+        with open(cache.index_path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        reopened = TermCache(cache_path, every=10)
+        assert reopened.indexes == [10]
+
+        # Appending after the tear must still leave a readable index.
+        reopened.save(20, nth(20), nth(21))
+        reopened.save(30, nth(30), nth(31))
+        final = TermCache(cache_path, every=10)
+        assert final.indexes == [10, 20, 30]
+        assert final.nearest(35) == (30, nth(30), nth(31))
@@ -0,0 +1,149 @@
+"""A small micro-benchmark harness: warmup, repeated timing, robust statistics, and baseline comparison."""
+
+import dataclasses
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+DEFAULT_WARMUP = 3
+DEFAULT_REPEATS = 15
+MIN_REPEAT_NS = 20_000_000  # calibrate loops per repeat so each repeat takes at least 20 ms
+DEFAULT_THRESHOLD = 0.10  # flag a regression when the median is more than 10% slower than baseline
+
+
+@dataclasses.dataclass
+class BenchResult:
+    """Timing statistics for one benchmark, all times per call in nanoseconds."""
+
+    name: str
+    number: int  # calls per repeat
+    repeats: int
+    median_ns: float
+    q1_ns: float
+    q3_ns: float
+    min_ns: float
+    peak_bytes: int
+
+    @property
+    def iqr_ns(self) -> float:
+        return self.q3_ns - self.q1_ns
+
+
+def bench(
+    name: str,
+    func: Callable[[], object],
+    number: int | None = None,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    disable_gc: bool = True,
+) -> BenchResult:
+    """Time func() and return its per-call statistics.
+
+    func is called `warmup` times first, then timed over `repeats` repeats of `number` calls
+    each with time.perf_counter_ns. If number is None, it is calibrated so that one repeat
+    takes at least MIN_REPEAT_NS. The garbage collector is paused while timing (unless
+    disable_gc is False), and peak memory is measured in one extra call under tracemalloc,
+    since tracing would distort the timings.
+
+    Args:
+        name: Label for the result
+        func: The zero-argument callable to time
+        number: Calls per repeat, or None to calibrate
+        repeats: How many timed repeats to take (at least 2)
+        warmup: Untimed calls before timing starts
+        disable_gc: Pause garbage collection while timing
+
+    Returns:
+        BenchResult: Median, quartiles and minimum per call, plus peak traced memory
+    """
+    if repeats < 2:
+        raise ValueError('repeats must be at least 2')
+
+    for _ in range(warmup):
+        func()
+    if number is None:
+        number = _calibrate(func)
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.disable()
+    try:
+        times = [_time_repeat(func, number) / number for _ in range(repeats)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    q1, median, q3 = statistics.quantiles(times, n=4)
+    return BenchResult(name, number, repeats, median, q1, q3, min(times), peak_bytes)
+
+
+def compare(results: list[BenchResult], baseline: list[BenchResult], threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Describe every benchmark whose median got more than `threshold` slower than in baseline.
+
+    A slowdown that is within the baseline's own spread (current q1 below baseline q3) is
+    treated as noise and not flagged.
+    """
+    previous = {r.name: r for r in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(result.name)
+        if old is None:
+            continue
+        ratio = result.median_ns / old.median_ns
+        if ratio > 1 + threshold and result.q1_ns > old.q3_ns:
+            regressions.append(
+                f'{result.name}: {format_ns(old.median_ns)} -> {format_ns(result.median_ns)} ({ratio:.2f}x slower)'
+            )
+    return regressions
+
+
+def save_results(path: str, results: list[BenchResult]) -> None:
+    with open(path, 'w') as f:
+        json.dump([dataclasses.asdict(r) for r in results], f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> list[BenchResult]:
+    with open(path) as f:
+        return [BenchResult(**r) for r in json.load(f)]
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f'{ns / scale:,.2f} {unit}'
+    return f'{ns:,.0f} ns'
+
+
+def format_result(result: BenchResult) -> str:
+    return (
+        f'{result.name:<40} median {format_ns(result.median_ns):>11}  IQR {format_ns(result.iqr_ns):>11}  '
+        f'peak {result.peak_bytes / 1024:,.1f} KB  ({result.repeats} x {result.number})'
+    )
+
+
+def _time_repeat(func: Callable[[], object], number: int) -> int:
+    t0 = time.perf_counter_ns()
+    for _ in range(number):
+        func()
+    return time.perf_counter_ns() - t0
+
+
+def _calibrate(func: Callable[[], object]) -> int:
+    # Like timeit's autorange: try 1, 2, 5, 10, 20, 50, ... calls until a repeat is long enough to time well.
+    for exponent in range(10):
+        for multiplier in (1, 2, 5):
+            number = multiplier * 10**exponent
+            if _time_repeat(func, number) >= MIN_REPEAT_NS:
+                return number
+    return number
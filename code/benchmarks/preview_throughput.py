@@ -0,0 +1,75 @@
+"""Throughput of batch_preview's concurrent, pooled fetching versus show_first_chars one URL at a time.
+
+Both fetch the same URLs from a local test server that adds a fixed latency to every response,
+standing in for the network round trips that dominate previewing real sites:
+
+    python preview_throughput.py --urls 200 --latency 0.05 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import microbench
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / '02-python-lang'))
+
+import batch_preview  # noqa: E402
+import local_server  # noqa: E402
+import show_first_chars  # noqa: E402
+
+
+def sequential(urls: list[str]) -> int:
+    # What show_first_chars.py does per run: one URL, one fresh connection, one after another.
+    return sum(show_first_chars.first_chars(url).bytes_transferred for url in urls)
+
+
+def concurrent(urls: list[str], concurrency: int) -> int:
+    async def run() -> int:
+        results = [r async for r in batch_preview.preview_many(urls, concurrency=concurrency, per_host=concurrency)]
+        failures = [r for r in results if isinstance(r, batch_preview.PreviewError)]
+        if failures:
+            raise RuntimeError(f'{len(failures)} previews failed, e.g. {failures[0]}')
+        return sum(r.bytes_transferred for r in results)
+
+    return asyncio.run(run())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--urls', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds the server waits before each response')
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    server = local_server.start_server(args.latency)
+    base = f'http://127.0.0.1:{server.server_port}'
+    urls = [f'{base}/page/{i}' for i in range(args.urls)]
+    try:
+        results = [
+            microbench.bench(
+                'sequential first_chars', lambda: sequential(urls), number=1, repeats=args.repeats, warmup=0
+            ),
+            microbench.bench(
+                f'batch_preview x{args.concurrency}',
+                lambda: concurrent(urls, args.concurrency),
+                number=1,
+                repeats=args.repeats,
+                warmup=0,
+            ),
+        ]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for result in results:
+        rate = args.urls / (result.median_ns / 1e9)
+        print(f'{microbench.format_result(result)}  {rate:,.0f} URLs/s')
+    print(f'Speed up is {results[0].median_ns / results[1].median_ns:,.1f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Benchmark suite for the course's Fibonacci functions and the speedtest lookups.
+
+Run it from anywhere, optionally saving the results as a baseline and comparing against one:
+
+    python run_benchmarks.py --output baseline.json
+    python run_benchmarks.py --baseline baseline.json --threshold 0.1
+
+The exit status is 1 if any benchmark regressed past the threshold, so it can gate CI.
+"""
+
+import argparse
+import itertools
+import random
+import string
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import microbench
+
+CODE_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [
+    str(CODE_DIR / '09-agentic-ai' / 'math-research'),
+    str(CODE_DIR / '05-organizing-and-reusing-code' / 'mathfib'),
+    str(CODE_DIR / '02-python-lang'),
+]
+
+import mathf  # noqa: E402
+import mathfib  # noqa: E402
+import people_store  # noqa: E402
+
+FIB_TERMS = 10_000
+NTH_INDEX = 100_000
+MULTIPLE = 7
+MULTIPLES_COUNT = 200
+PEOPLE_COUNT = 100_000
+SEED = 42
+
+
+def fibonacci_cases() -> dict[str, Callable[[], object]]:
+    return {
+        'mathf.fibonacci 10k terms': lambda: list(itertools.islice(mathf.fibonacci(), FIB_TERMS)),
+        'mathfib.fibonacci 10k terms': lambda: list(itertools.islice(mathfib.fibonacci(), FIB_TERMS)),
+        'mathf.nth 100k': lambda: mathf.nth(NTH_INDEX),
+        'mathf.fib_range 10k terms': lambda: list(mathf.fib_range(NTH_INDEX, NTH_INDEX + FIB_TERMS)),
+        'mathf.multiples_of 200 multiples of 7': lambda: list(
+            itertools.islice(mathf.multiples_of(mathf.fibonacci(), MULTIPLE), MULTIPLES_COUNT)
+        ),
+        'mathf.fibonacci_multiples_of 200 of 7': lambda: list(
+            itertools.islice(mathf.fibonacci_multiples_of(MULTIPLE), MULTIPLES_COUNT)
+        ),
+        'mathf.tribonacci_nth 100k': lambda: mathf.tribonacci_nth(NTH_INDEX),
+        'mathf.fib_mod 10**18 mod 10**9+7': lambda: mathf.fib_mod(10**18, 10**9 + 7),
+    }
+
+
+def speedtest_cases() -> dict[str, Callable[[], object]]:
+    # The same people and lookups as speedtest.py, built once here so that only the lookups are timed.
+    rng = random.Random(SEED)
+    people = [
+        {
+            'name': ''.join(rng.choices(string.ascii_lowercase, k=8)),
+            'email': ''.join(rng.choices(string.ascii_lowercase, k=8)) + '@gmail.com',
+            'age': rng.randint(30, 60),
+        }
+        for _ in range(PEOPLE_COUNT)
+    ]
+    lookup = {p['email']: p for p in people}
+    email = people[len(people) // 2]['email']
+
+    store = people_store.PeopleStore.from_dicts(people, name_width=8, email_width=18)
+    by_email = store.add_index(people_store.HashIndex('email'))
+    by_age = store.add_index(people_store.SortedIndex('age'))
+    by_name = store.add_index(people_store.PrefixIndex('name'))
+
+    def list_scan():
+        for p in people:
+            if p['email'] == email:
+                return p
+        return None
+
+    return {
+        'speedtest list scan 100k people': list_scan,
+        'speedtest dict lookup 100k people': lambda: lookup.get(email),
+        'people_store email lookup 100k people': lambda: store.rows(by_email.lookup(email)),
+        'people_store age range 100k people': lambda: by_age.range(40, 42),
+        'people_store name prefix 100k people': lambda: store.rows(by_name.startswith('abc')),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--repeats', type=int, default=microbench.DEFAULT_REPEATS)
+    parser.add_argument('--warmup', type=int, default=microbench.DEFAULT_WARMUP)
+    parser.add_argument('--keep-gc', action='store_true', help='leave the garbage collector running while timing')
+    parser.add_argument('--output', help='save the results as JSON')
+    parser.add_argument('--baseline', help='compare against results saved earlier with --output')
+    parser.add_argument('--threshold', type=float, default=microbench.DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    cases = fibonacci_cases() | speedtest_cases()
+    results = []
+    for name, func in cases.items():
+        if args.filter not in name:
+            continue
+        result = microbench.bench(name, func, repeats=args.repeats, warmup=args.warmup, disable_gc=not args.keep_gc)
+        print(microbench.format_result(result))
+        results.append(result)
+
+    if args.output:
+        microbench.save_results(args.output, results)
+    if args.baseline and not Path(args.baseline).exists():
+        print(f'No baseline at {args.baseline} yet, nothing to compare against')
+    elif args.baseline:
+        regressions = microbench.compare(results, microbench.load_results(args.baseline), args.threshold)
+        for line in regressions:
+            print(f'REGRESSION {line}')
+        if regressions:
+            return 1
+        print(f'No regressions beyond {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Unit tests for the microbench module and the run_benchmarks regression gate."""
+
+import statistics
+import sys
+
+import pytest
+import microbench
+import run_benchmarks
+from microbench import BenchResult, bench, compare
+
+CASE = 'mathf.fib_mod 10**18 mod 10**9+7'  # one of run_benchmarks' fastest cases
+
+
+def result(name: str, median_ns: float, spread_ns: float) -> BenchResult:
+    return BenchResult(name, 1, 15, median_ns, median_ns - spread_ns, median_ns + spread_ns, median_ns - spread_ns, 0)
+
+
+class TestBench:
+    """Tests for timing a function."""
+
+    def test_fixed_repeats_and_number(self):
+        """Test that fixed repeats and number are honored, and the statistics agree with each other."""
+        calls = []
+        outcome = bench('append', lambda: calls.append(1), number=10, repeats=5, warmup=2)
+        assert (outcome.number, outcome.repeats) == (10, 5)
+        assert len(calls) == 2 + 5 * 10 + 1  # warmup, timed repeats, and one call under tracemalloc
+        assert outcome.min_ns <= outcome.q1_ns <= outcome.median_ns <= outcome.q3_ns
+        assert outcome.iqr_ns == outcome.q3_ns - outcome.q1_ns
+
+    def test_median_matches_the_samples(self, monkeypatch):
+        """Test that the median and quartiles are those of the per-call repeat times."""
+        samples = iter([500, 100, 400, 300, 200])
+        monkeypatch.setattr(microbench, '_time_repeat', lambda func, number: next(samples) * number)
+        outcome = bench('fixed', lambda: None, number=4, repeats=5, warmup=0)
+        q1, median, q3 = statistics.quantiles([500, 100, 400, 300, 200], n=4)
+        assert (outcome.q1_ns, outcome.median_ns, outcome.q3_ns, outcome.min_ns) == (q1, median, q3, 100)
+
+    def test_one_repeat_raises_error(self):
+        """Test that a single repeat, which has no spread, raises ValueError."""
+        with pytest.raises(ValueError, match='at least 2'):
+            bench('once', lambda: None, number=1, repeats=1)
+
+
+class TestCompare:
+    """Tests for comparing results against a baseline."""
+
+    def test_within_threshold_is_not_a_regression(self):
+        """Test that a median less than threshold slower is not reported."""
+        assert compare([result('a', 105, 1)], [result('a', 100, 1)], threshold=0.10) == []
+
+    def test_clear_slowdown_is_a_regression(self):
+        """Test that a median well past the threshold, with no overlap in spread, is reported."""
+        regressions = compare([result('a', 200, 1)], [result('a', 100, 1)], threshold=0.10)
+        assert len(regressions) == 1
+        assert regressions[0].startswith('a: ')
+        assert '2.00x slower' in regressions[0]
+
+    def test_overlapping_spread_is_noise(self):
+        """Test that a slower median is not reported while its IQR overlaps the baseline's."""
+        assert compare([result('a', 130, 40)], [result('a', 100, 40)], threshold=0.10) == []
+
+    def test_new_benchmark_is_skipped(self):
+        """Test that a benchmark missing from the baseline is not compared."""
+        assert compare([result('new', 1_000, 1)], [result('old', 1, 0)]) == []
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test that saved results load back unchanged."""
+        path = str(tmp_path / 'results.json')
+        results = [result('a', 100, 5), result('b', 2_000, 50)]
+        microbench.save_results(path, results)
+        assert microbench.load_results(path) == results
+
+
+class TestRunBenchmarks:
+    """Tests for the run_benchmarks command line."""
+
+    def run(self, monkeypatch, *args: str) -> int:
+        monkeypatch.setattr(
+            sys, 'argv', ['run_benchmarks.py', '--filter', CASE, '--repeats', '2', '--warmup', '0', *args]
+        )
+        return run_benchmarks.main()
+
+    def test_regression_exits_with_1(self, monkeypatch, tmp_path, capsys):
+        """Test that a benchmark far slower than its baseline makes main return 1."""
+        baseline = str(tmp_path / 'baseline.json')
+        microbench.save_results(baseline, [result(CASE, 1, 0)])
+        assert self.run(monkeypatch, '--baseline', baseline) == 1
+        assert f'REGRESSION {CASE}' in capsys.readouterr().out
+
+    def test_no_regression_exits_with_0(self, monkeypatch, tmp_path):
+        """Test that comparing against a much slower baseline returns 0."""
+        baseline = str(tmp_path / 'baseline.json')
+        microbench.save_results(baseline, [result(CASE, 1e12, 0)])
+        assert self.run(monkeypatch, '--baseline', baseline) == 0
+
+    def test_missing_baseline_file(self, monkeypatch, tmp_path, capsys):
+        """Test that a baseline file that does not exist yet is reported, not raised, and the results still saved."""
+        output = str(tmp_path / 'results.json')
+        assert self.run(monkeypatch, '--baseline', str(tmp_path / 'nope.json'), '--output', output) == 0
+        assert 'No baseline' in capsys.readouterr().out
+        assert [r.name for r in microbench.load_results(output)] == [CASE]